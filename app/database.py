@@ -2,9 +2,14 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from app.config import settings
 
-# SQLAlchemy engine for database connections
+# SQLAlchemy engine for database connections. The compiled statement
+# cache is sized above the default so the per-request auth and roster
+# queries stay cached alongside the rest of the app's query shapes.
 engine = create_engine(
-    settings.SQLALCHEMY_DATABASE_URI, echo=False, future=True
+    settings.SQLALCHEMY_DATABASE_URI,
+    echo=False,
+    future=True,
+    query_cache_size=1200,
 )
 
 # Factory for creating new database sessions
@@ -22,6 +27,9 @@ def get_db():
     Yields:
         Session: SQLAlchemy database session.
     Ensures session is closed after use.
+
+    FastAPI caches dependency results per request, so the auth
+    dependencies and the route handler all share this one session.
     """
     db = SessionLocal()
     try:
@@ -1,5 +1,6 @@
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from app.utils.logger import get_logger
 from app.utils.request_logger import RequestLoggingMiddleware
 from app.database import Base, engine
@@ -44,6 +45,11 @@ async def lifespan(app: FastAPI):
 
     yield
 
+    # Release pooled WarcraftLogs connections on shutdown
+    from app.utils.warcraftlogs import warcraftlogs_api
+
+    warcraftlogs_api.close()
+
 
 def create_app() -> FastAPI:
     """App Factory to create a FastAPI app instance."""
@@ -52,6 +58,9 @@ def create_app() -> FastAPI:
         description=settings.APP_DESCRIPTION,
         version=settings.VERSION,
         lifespan=lifespan,
+        # Serialize responses with orjson (already used by the WarcraftLogs
+        # client); roster and attendance views return large JSON bodies
+        default_response_class=ORJSONResponse,
         # Documentation customization
         docs_url="/docs",
         redoc_url="/redoc",
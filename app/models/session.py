@@ -1,4 +1,12 @@
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, DateTime
+from sqlalchemy import (
+    Boolean,
+    Column,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    DateTime,
+)
 from sqlalchemy.orm import relationship
 from datetime import datetime, timedelta
 import secrets
@@ -11,7 +19,7 @@ class Session(Base):
     __tablename__ = "sessions"
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
-    session_id = Column(String, unique=True, nullable=False, index=True)
+    session_id = Column(String, nullable=False)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     created_at = Column(DateTime, default=datetime.now)
     expires_at = Column(DateTime, nullable=False)
@@ -20,6 +28,23 @@ class Session(Base):
     # Relationship
     user = relationship("User", back_populates="sessions")
 
+    __table_args__ = (
+        # Cookie lookups filter on session_id; including the remaining
+        # columns lets Postgres answer them with an index-only scan
+        Index(
+            "ix_sessions_session_id_covering",
+            "session_id",
+            unique=True,
+            postgresql_include=[
+                "id",
+                "user_id",
+                "created_at",
+                "expires_at",
+                "is_active",
+            ],
+        ),
+    )
+
     @classmethod
     def generate_session_id(cls, length: int = 32) -> str:
         """Generate a secure random session ID."""
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Response
+from sqlalchemy import tuple_
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime, timedelta
@@ -79,6 +80,14 @@ def get_attendance_or_404(db: Session, attendance_id: int) -> Attendance:
     return attendance
 
 
+def _reload_attendance(db: Session, records: List[Attendance]) -> None:
+    """Load expired attendance records back from the database in one query."""
+    if records:
+        db.query(Attendance).filter(
+            Attendance.id.in_([record.id for record in records])
+        ).all()
+
+
 def get_raid_or_404(db: Session, raid_id: int) -> Raid:
     """Get raid by ID or raise 404."""
     raid = db.query(Raid).filter(Raid.id == raid_id).first()
@@ -174,24 +183,42 @@ def create_attendance_bulk(
     """
     Create multiple attendance records. Superuser only.
     """
+    records = bulk_in.attendance_records
+
+    # Validate the whole batch with one query per table instead of three
+    # lookups per record
+    raid_ids = list({record.raid_id for record in records})
+    toon_ids = list({record.toon_id for record in records})
+    existing_raid_ids = {
+        raid_id
+        for (raid_id,) in db.query(Raid.id).filter(Raid.id.in_(raid_ids))
+    }
+    existing_toon_ids = {
+        toon_id
+        for (toon_id,) in db.query(Toon.id).filter(Toon.id.in_(toon_ids))
+    }
+    existing_pairs = {
+        (raid_id, toon_id)
+        for raid_id, toon_id in db.query(
+            Attendance.raid_id, Attendance.toon_id
+        ).filter(
+            tuple_(Attendance.raid_id, Attendance.toon_id).in_(
+                [(record.raid_id, record.toon_id) for record in records]
+            )
+        )
+    }
+
     created_records = []
 
-    for record in bulk_in.attendance_records:
+    for record in records:
         # Verify raid and toon exist
-        raid = get_raid_or_404(db, record.raid_id)
-        toon = get_toon_or_404(db, record.toon_id)
+        if record.raid_id not in existing_raid_ids:
+            raise HTTPException(status_code=404, detail="Raid not found")
+        if record.toon_id not in existing_toon_ids:
+            raise HTTPException(status_code=404, detail="Toon not found")
 
         # Check for existing attendance record
-        existing = (
-            db.query(Attendance)
-            .filter(
-                Attendance.raid_id == record.raid_id,
-                Attendance.toon_id == record.toon_id,
-            )
-            .first()
-        )
-
-        if existing:
+        if (record.raid_id, record.toon_id) in existing_pairs:
             raise HTTPException(
                 status_code=400,
                 detail=f"Attendance record already exists for raid {record.raid_id} and toon {record.toon_id}",
@@ -200,18 +227,19 @@ def create_attendance_bulk(
         attendance = Attendance(
             raid_id=record.raid_id,
             toon_id=record.toon_id,
-            status=record.status,
+            # The schema's str enum isn't the model enum; the column stores
+            # member names, so convert by value
+            status=AttendanceStatus(record.status.value),
             notes=record.notes,
             benched_note=record.benched_note,
         )
-        db.add(attendance)
         created_records.append(attendance)
 
+    db.add_all(created_records)
     db.commit()
 
-    # Refresh all created records
-    for record in created_records:
-        db.refresh(record)
+    # Reload all created records in one query rather than one refresh each
+    _reload_attendance(db, created_records)
 
     return created_records
 
@@ -277,13 +305,27 @@ def update_attendance_bulk(
     """
     Update multiple attendance records. Superuser only.
     """
+    records = bulk_in.attendance_records
+    attendance_by_id = {
+        attendance.id: attendance
+        for attendance in db.query(Attendance).filter(
+            Attendance.id.in_([record.id for record in records])
+        )
+    }
+
     updated_records = []
 
-    for record in bulk_in.attendance_records:
-        attendance = get_attendance_or_404(db, record.id)
+    for record in records:
+        attendance = attendance_by_id.get(record.id)
+        if attendance is None:
+            raise HTTPException(
+                status_code=404, detail="Attendance record not found"
+            )
         update_data = record.model_dump(exclude_unset=True, exclude={"id"})
-        if "status" in update_data:
-            attendance.status = update_data["status"]  # type: ignore[assignment]
+        if update_data.get("status") is not None:
+            attendance.status = AttendanceStatus(  # type: ignore[assignment]
+                update_data["status"].value
+            )
         if "notes" in update_data:
             attendance.notes = update_data["notes"]  # type: ignore[assignment]
         if "benched_note" in update_data:
@@ -292,9 +334,8 @@ def update_attendance_bulk(
 
     db.commit()
 
-    # Refresh all updated records
-    for record in updated_records:
-        db.refresh(record)
+    # Reload all updated records in one query rather than one refresh each
+    _reload_attendance(db, updated_records)
 
     return updated_records
 
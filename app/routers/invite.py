@@ -16,7 +16,7 @@ from app.utils.auth import (
     security,
 )
 from app.utils.invite import (
-    ensure_unique_code,
+    create_unique_invite,
     calculate_expiration_date,
     is_invite_expired,
 )
@@ -51,29 +51,22 @@ def create_invite(
         f"Creating invite code by superuser {current_user.username} with expiration: {invite_data.expires_in_days} days"
     )
 
-    # Generate unique code
-    code = ensure_unique_code(db)
-
     # Calculate expiration date
     expires_at = calculate_expiration_date(invite_data.expires_in_days)
 
-    # Create invite
-    invite = Invite(
-        code=code,
+    # Create invite; the unique constraint on code handles collisions
+    invite = create_unique_invite(
+        db,
         created_by=current_user.id,
         expires_at=expires_at,
         is_superuser_invite=invite_data.is_superuser_invite,
     )
 
-    db.add(invite)
-    db.commit()
-    db.refresh(invite)
-
     # Add usernames for response
     invite.creator_username = current_user.username
     invite.is_expired = is_invite_expired(invite)
 
-    logger.info(f"Invite code {code} created successfully")
+    logger.info(f"Invite code {invite.code} created successfully")
     return invite
 
 
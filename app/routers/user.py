@@ -21,6 +21,7 @@ from app.utils.auth import (
 )
 from app.utils.password import hash_password, verify_password
 from app.utils.invite import use_invite_code
+from app.utils.session_auth import clear_session_cache, invalidate_session
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -352,6 +353,7 @@ def update_user(
 
     db.commit()
     db.refresh(user)
+    clear_session_cache()
 
     logger.info(f"User {user.username} updated successfully")
     return user
@@ -387,6 +389,7 @@ def delete_user(
 
     db.delete(user)
     db.commit()
+    clear_session_cache()
 
     logger.info(f"User {user.username} deleted successfully")
     return {"message": "User deleted successfully"}
@@ -415,6 +418,9 @@ def logout_user(
             session.is_active = False  # type: ignore
             db.commit()
             logger.info(f"Deactivated session for user {session.user_id}")
+        # Evict after the commit so a concurrent request can't re-cache
+        # the still-active row
+        invalidate_session(session_id)
 
     # Clear the session cookie
     response.delete_cookie(key="session_id", path="/")
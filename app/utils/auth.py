@@ -6,8 +6,8 @@ from typing import Optional
 from app.database import get_db
 from app.models.token import Token
 from app.models.user import User
-from app.models.session import Session as SessionModel
 from app.utils.logger import get_logger
+from app.utils.session_auth import get_session_and_user_from_cookie
 
 logger = get_logger(__name__)
 # Configure security scheme for OpenAPI docs
@@ -43,33 +43,6 @@ def get_token_from_cookie(
     return token
 
 
-def get_session_from_cookie(
-    request: Request, db: Session = Depends(get_db)
-) -> Optional[SessionModel]:
-    """Get session from session cookie."""
-    session_id = request.cookies.get("session_id")
-    logger.debug(f"Session ID from cookie: {session_id}")
-    if not session_id:
-        logger.debug("No session ID found in cookie")
-        return None
-
-    session = (
-        db.query(SessionModel)
-        .filter(SessionModel.session_id == session_id)
-        .first()
-    )
-    if not session:
-        logger.debug("No session found in database")
-        return None
-
-    if not session.is_valid():
-        logger.debug("Session is invalid")
-        return None
-
-    logger.debug(f"Valid session found: user_id={session.user_id}")
-    return session
-
-
 def get_current_token(
     request: Request,
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
@@ -127,10 +100,10 @@ def get_current_user(
 
     # Try session-based auth
     logger.debug("Trying session-based auth")
-    session = get_session_from_cookie(request, db)
-    logger.debug(f"Session-based auth result: {session is not None}")
-    if session:
-        user = db.query(User).filter(User.id == session.user_id).first()
+    auth_pair = get_session_and_user_from_cookie(request, db)
+    logger.debug(f"Session-based auth result: {auth_pair is not None}")
+    if auth_pair:
+        user = auth_pair[1]
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -1,7 +1,9 @@
 from PIL import Image, ImageDraw, ImageFont
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
+from functools import lru_cache
 import io
+import time
 import zipfile
 from app.schemas.attendance import (
     TeamViewData,
@@ -43,6 +45,15 @@ class AttendanceImageGenerator:
         self.font_size_large = 20
         self.font_size_xlarge = 24
         self.font_size_title = 32
+        # Attendance percentage colors, indexed by threshold bucket
+        self._att_colors = (
+            self.COLORS["error"],
+            self.COLORS["warning"],
+            self.COLORS["success"],
+        )
+        # Reused across reports generated by this instance
+        self._img_pool: Optional[Image.Image] = None
+        self._png_buffer: Optional[io.BytesIO] = None
 
     def _get_font(
         self, size: int, bold: bool = False
@@ -56,6 +67,10 @@ class AttendanceImageGenerator:
         except:
             return ImageFont.load_default()
 
+    def _att_color(self, percentage: float) -> Tuple[int, int, int]:
+        """Get the color for an attendance percentage (<60, <80, >=80)."""
+        return self._att_colors[(percentage >= 60) + (percentage >= 80)]
+
     def _draw_rounded_rectangle(
         self,
         draw: ImageDraw.Draw,
@@ -64,59 +79,35 @@ class AttendanceImageGenerator:
         radius: int = 4,
     ):
         """Draw a rounded rectangle."""
-        x1, y1, x2, y2 = bbox
+        draw.rounded_rectangle(bbox, radius=radius, fill=fill)
 
-        # Draw main rectangle
-        draw.rectangle([x1 + radius, y1, x2 - radius, y2], fill=fill)
-        draw.rectangle([x1, y1 + radius, x2, y2 - radius], fill=fill)
-
-        # Draw corners
-        draw.pieslice(
-            [x1, y1, x1 + 2 * radius, y1 + 2 * radius], 180, 270, fill=fill
-        )
-        draw.pieslice(
-            [x2 - 2 * radius, y1, x2, y1 + 2 * radius], 270, 360, fill=fill
-        )
-        draw.pieslice(
-            [x1, y2 - 2 * radius, x1 + 2 * radius, y2], 90, 180, fill=fill
-        )
-        draw.pieslice(
-            [x2 - 2 * radius, y2 - 2 * radius, x2, y2], 0, 90, fill=fill
-        )
+    def _get_cell_style(self, status: str) -> Tuple[tuple, tuple, str]:
+        """Get background color, text color and symbol for a status."""
+        if status == "present":
+            return self.COLORS["success"], (255, 255, 255), "✓"
+        elif status == "absent":
+            return self.COLORS["error"], (255, 255, 255), "✗"
+        elif status == "benched":
+            # Black text on yellow for better contrast
+            return self.COLORS["warning"], (0, 0, 0), "B"
+        return self.COLORS["text_muted"], (255, 255, 255), "?"
 
-    def _draw_attendance_cell(
+    def _draw_cell_symbol(
         self,
         draw: ImageDraw.Draw,
         x: int,
         y: int,
         size: int,
         status: str,
-        note_id: Optional[int] = None,
+        font: ImageFont.FreeTypeFont,
     ):
-        """Draw an attendance status cell with improved readability."""
-        # Background color based on status
-        if status == "present":
-            bg_color = self.COLORS["success"]
-            text_color = (255, 255, 255)
-            symbol = "✓"  # Proper checkmark
-        elif status == "absent":
-            bg_color = self.COLORS["error"]
-            text_color = (255, 255, 255)
-            symbol = "✗"  # Proper X
-        elif status == "benched":
-            bg_color = self.COLORS["warning"]
-            text_color = (0, 0, 0)  # Black text on yellow for better contrast
-            symbol = "B"
-        else:
-            bg_color = self.COLORS["text_muted"]
-            text_color = (255, 255, 255)
-            symbol = "?"
+        """Draw a status cell background and its centered symbol."""
+        bg_color, text_color, symbol = self._get_cell_style(status)
 
         # Draw cell background
         self._draw_rounded_rectangle(draw, (x, y, x + size, y + size), bg_color)
 
         # Draw symbol with larger font for better readability
-        font = self._get_font(self.font_size_large, bold=True)
         bbox = draw.textbbox((0, 0), symbol, font=font)
         text_width = bbox[2] - bbox[0]
         text_height = bbox[3] - bbox[1]
@@ -124,17 +115,80 @@ class AttendanceImageGenerator:
         text_y = y + (size - text_height) // 2
         draw.text((text_x, text_y), symbol, fill=text_color, font=font)
 
+    def _draw_note_indicator(
+        self,
+        draw: ImageDraw.Draw,
+        x: int,
+        y: int,
+        size: int,
+        note_id: int,
+        note_font: ImageFont.FreeTypeFont,
+    ):
+        """Draw a note reference as a superscript on a cell."""
+        note_text = f"[{note_id}]"
+        # Position as superscript (top right, smaller and higher)
+        draw.text(
+            (x + size - 8, y - 8),
+            note_text,
+            fill=(255, 255, 255),  # White for visibility
+            font=note_font,
+        )
+
+    def _render_cell_sprite(
+        self, size: int, status: str, font: ImageFont.FreeTypeFont
+    ) -> Image.Image:
+        """Render a status cell once so it can be pasted for every raid."""
+        sprite = Image.new("RGBA", (size + 1, size + 1), (0, 0, 0, 0))
+        self._draw_cell_symbol(
+            ImageDraw.Draw(sprite), 0, 0, size, status, font
+        )
+        return sprite
+
+    def _draw_attendance_cell(
+        self,
+        draw: ImageDraw.Draw,
+        x: int,
+        y: int,
+        size: int,
+        status: str,
+        note_id: Optional[int] = None,
+        font: Optional[ImageFont.FreeTypeFont] = None,
+        note_font: Optional[ImageFont.FreeTypeFont] = None,
+    ):
+        """Draw an attendance status cell with improved readability."""
+        if font is None:
+            font = self._get_font(self.font_size_large, bold=True)
+        self._draw_cell_symbol(draw, x, y, size, status, font)
+
         # Draw note indicator as superscript (only if there's a note)
         if note_id is not None:
-            note_font = self._get_font(12, bold=True)
-            note_text = f"[{note_id}]"
-            # Position as superscript (top right, smaller and higher)
-            draw.text(
-                (x + size - 8, y - 8),
-                note_text,
-                fill=(255, 255, 255),  # White for visibility
-                font=note_font,
+            if note_font is None:
+                note_font = self._get_font(12, bold=True)
+            self._draw_note_indicator(draw, x, y, size, note_id, note_font)
+
+    def _get_canvas(self) -> Image.Image:
+        """Get a cleared canvas, reusing the previous one when possible."""
+        img = self._img_pool
+        if img is None or img.size != (self.width, self.height):
+            img = Image.new(
+                "RGB", (self.width, self.height), self.COLORS["background"]
+            )
+            self._img_pool = img
+        else:
+            img.paste(
+                self.COLORS["background"], (0, 0, self.width, self.height)
             )
+        return img
+
+    def _encode_png(self, img: Image.Image) -> bytes:
+        """Encode an image as PNG bytes using a reusable buffer."""
+        if self._png_buffer is None:
+            self._png_buffer = io.BytesIO()
+        buffer = self._png_buffer
+        buffer.seek(0)
+        buffer.truncate(0)
+        img.save(buffer, format="PNG", optimize=True)
+        return buffer.getvalue()
 
     def _format_date(self, date_str: str) -> str:
         """Format date string for display in a readable format."""
@@ -166,11 +220,23 @@ class AttendanceImageGenerator:
     ) -> bytes:
         """Generate attendance report image for a team."""
         # Create image with dark background
-        img = Image.new(
-            "RGB", (self.width, self.height), self.COLORS["background"]
-        )
+        img = self._get_canvas()
         draw = ImageDraw.Draw(img)
 
+        # Load fonts once per report rather than per row/cell
+        title_font = self._get_font(self.font_size_title, bold=True)
+        team_font = self._get_font(self.font_size_large)
+        period_font = self._get_font(self.font_size_normal)
+        header_font = self._get_font(self.font_size_normal, bold=True)
+        info_font = self._get_font(self.font_size_normal)
+        legend_font = self._get_font(self.font_size_small)
+        cell_font = self._get_font(self.font_size_large, bold=True)
+        note_font = self._get_font(12, bold=True)
+        footnotes_font = self._get_font(self.font_size_small)
+
+        # Status cells rendered once per report, keyed by status
+        cell_sprites: Dict[str, Image.Image] = {}
+
         # Collect all notes for footnotes
         notes_collection = []
         note_counter = 1
@@ -181,7 +247,6 @@ class AttendanceImageGenerator:
         draw.rectangle([0, 0, self.width, header_height], fill=header_bg)
 
         # Title
-        title_font = self._get_font(self.font_size_title, bold=True)
         title = f"{guild.name} Attendance Report"
         title_bbox = draw.textbbox((0, 0), title, font=title_font)
         title_width = title_bbox[2] - title_bbox[0]
@@ -194,7 +259,6 @@ class AttendanceImageGenerator:
         )
 
         # Team name
-        team_font = self._get_font(self.font_size_large)
         team_name = f"Team: {team_data.team['name']}"
         team_bbox = draw.textbbox((0, 0), team_name, font=team_font)
         team_width = team_bbox[2] - team_bbox[0]
@@ -204,7 +268,6 @@ class AttendanceImageGenerator:
         )
 
         # Period
-        period_font = self._get_font(self.font_size_normal)
         period_text = self._get_period_text(start_date, end_date)
         period_bbox = draw.textbbox((0, 0), period_text, font=period_font)
         period_width = period_bbox[2] - period_bbox[0]
@@ -232,7 +295,6 @@ class AttendanceImageGenerator:
 
         # Table header
         header_y = table_start_y
-        header_font = self._get_font(self.font_size_normal, bold=True)
 
         # Draw header background
         draw.rectangle(
@@ -304,7 +366,6 @@ class AttendanceImageGenerator:
 
             # Toon info
             x_offset = 40
-            info_font = self._get_font(self.font_size_normal)
 
             # Toon name
             draw.text(
@@ -344,12 +405,7 @@ class AttendanceImageGenerator:
             )
 
             # Color code attendance percentage
-            if toon.overall_attendance_percentage >= 80:
-                color = self.COLORS["success"]
-            elif toon.overall_attendance_percentage >= 60:
-                color = self.COLORS["warning"]
-            else:
-                color = self.COLORS["error"]
+            color = self._att_color(toon.overall_attendance_percentage)
 
             draw.text(
                 (attendance_x, current_y + 12),
@@ -388,21 +444,27 @@ class AttendanceImageGenerator:
                             note_id = note_counter
                             note_counter += 1
 
-                    self._draw_attendance_cell(
-                        draw,
-                        x_offset + 20,
-                        current_y + 8,
-                        30,
-                        record.status,
-                        note_id,
-                    )
+                    # Paste a pre-rendered cell instead of redrawing it
+                    sprite = cell_sprites.get(record.status)
+                    if sprite is None:
+                        sprite = self._render_cell_sprite(
+                            30, record.status, cell_font
+                        )
+                        cell_sprites[record.status] = sprite
+                    cell_x = x_offset + 20
+                    cell_y = current_y + 8
+                    img.paste(sprite, (cell_x, cell_y), sprite)
+
+                    if note_id is not None:
+                        self._draw_note_indicator(
+                            draw, cell_x, cell_y, 30, note_id, note_font
+                        )
                 x_offset += raid_col_width
 
             current_y += row_height
 
         # Legend
         legend_y = self.height - 180
-        legend_font = self._get_font(self.font_size_small)
 
         # Legend background
         draw.rectangle(
@@ -453,7 +515,6 @@ class AttendanceImageGenerator:
         # Footnotes section
         if notes_collection:
             footnotes_y = legend_y + 80
-            footnotes_font = self._get_font(self.font_size_small)
 
             # Footnotes background
             draw.rectangle(
@@ -489,9 +550,7 @@ class AttendanceImageGenerator:
                 current_note_y += 25
 
         # Convert to bytes
-        img_bytes = io.BytesIO()
-        img.save(img_bytes, format="PNG", optimize=True)
-        return img_bytes.getvalue()
+        return self._encode_png(img)
 
     def generate_multiple_reports(
         self,
@@ -502,7 +561,8 @@ class AttendanceImageGenerator:
         """Generate multiple team reports and return as ZIP file."""
         zip_buffer = io.BytesIO()
 
-        with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
+        # PNGs are already compressed, so store them without deflating again
+        with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_STORED) as zip_file:
             for team_data, guild, start_date, end_date in reports_data:
                 # Generate image
                 image_bytes = self.generate_team_report(
@@ -523,9 +583,10 @@ class AttendanceImageGenerator:
         return zip_buffer.getvalue()
 
 
-def get_current_period() -> Tuple[datetime, datetime]:
-    """Get the current period (from previous Tuesday to now)."""
-    now = datetime.now()
+@lru_cache(maxsize=4)
+def _period_for_bucket(bucket: int) -> Tuple[datetime, datetime]:
+    """Compute the current period for a given minute bucket."""
+    now = datetime.fromtimestamp(bucket * 60)
 
     # Find the most recent Tuesday
     days_since_tuesday = (now.weekday() - 1) % 7  # Tuesday is 1
@@ -540,3 +601,9 @@ def get_current_period() -> Tuple[datetime, datetime]:
     end_date = now.replace(hour=23, minute=59, second=59, microsecond=999999)
 
     return start_date, end_date
+
+
+def get_current_period() -> Tuple[datetime, datetime]:
+    """Get the current period (from previous Tuesday to now)."""
+    # The period only changes at minute granularity, so memoize per minute
+    return _period_for_bucket(int(time.time() // 60))
@@ -3,6 +3,8 @@ import string
 from datetime import datetime, timedelta
 from typing import Optional
 from fastapi import HTTPException, status
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from app.models.invite import Invite
 from app.models.user import User
@@ -10,6 +12,9 @@ from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Unique index on invites.code; a violation means the code collided
+INVITE_CODE_INDEX = "ix_invites_code"
+
 
 def generate_invite_code() -> str:
     """Generate a cryptographically secure 8-character alphanumeric code."""
@@ -17,13 +22,49 @@ def generate_invite_code() -> str:
     return "".join(secrets.choice(alphabet) for _ in range(8))
 
 
-def ensure_unique_code(db: Session, max_attempts: int = 10) -> str:
-    """Generate a unique invite code, retrying if necessary."""
+def _is_code_collision(error: IntegrityError) -> bool:
+    """Check whether an IntegrityError came from the invites.code index."""
+    # diag is psycopg2-specific; under any other driver nothing matches and
+    # the error is re-raised
+    constraint_name = getattr(
+        getattr(error.orig, "diag", None), "constraint_name", None
+    )
+    return constraint_name == INVITE_CODE_INDEX
+
+
+def create_unique_invite(
+    db: Session,
+    created_by: int,
+    expires_at: Optional[datetime] = None,
+    is_superuser_invite: bool = False,
+    max_attempts: int = 10,
+) -> Invite:
+    """
+    Create and commit an invite with a unique code.
+
+    Relies on the unique constraint on ``invites.code`` to detect collisions,
+    so the common path is a single INSERT with no pre-check SELECT.
+    """
     for attempt in range(max_attempts):
-        code = generate_invite_code()
-        existing = db.query(Invite).filter(Invite.code == code).first()
-        if not existing:
-            return code
+        invite = Invite(
+            code=generate_invite_code(),
+            created_by=created_by,
+            expires_at=expires_at,
+            is_superuser_invite=is_superuser_invite,
+        )
+        db.add(invite)
+        try:
+            db.commit()
+        except IntegrityError as e:
+            db.rollback()
+            if not _is_code_collision(e):
+                raise
+            logger.warning(
+                f"Invite code collision on attempt {attempt + 1}, retrying"
+            )
+            continue
+        db.refresh(invite)
+        return invite
 
     # If we've exhausted attempts, raise an error
     raise HTTPException(
@@ -37,7 +78,29 @@ def validate_invite_code(code: str, db: Session) -> Invite:
     # Normalize to uppercase
     code = code.upper()
 
-    invite = db.query(Invite).filter(Invite.code == code).first()
+    # Common case: a single query that only matches usable invites
+    invite = (
+        db.query(Invite)
+        .filter(
+            Invite.code == code,
+            Invite.is_active.is_(True),
+            Invite.used_by.is_(None),
+            or_(
+                Invite.expires_at.is_(None),
+                Invite.expires_at >= datetime.now(),
+            ),
+        )
+        .first()
+    )
+    if invite:
+        return invite
+
+    # Otherwise look up just the status columns to report why it failed
+    invite = (
+        db.query(Invite.is_active, Invite.used_by, Invite.expires_at)
+        .filter(Invite.code == code)
+        .first()
+    )
     if not invite:
         logger.warning(f"Invalid invite code attempted: {code}")
         raise HTTPException(
@@ -58,14 +121,11 @@ def validate_invite_code(code: str, db: Session) -> Invite:
             detail="Invite code has already been used",
         )
 
-    if invite.expires_at and invite.expires_at < datetime.now():
-        logger.warning(f"Expired invite code attempted: {code}")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invite code has expired",
-        )
-
-    return invite
+    logger.warning(f"Expired invite code attempted: {code}")
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Invite code has expired",
+    )
 
 
 def use_invite_code(code: str, user_id: int, db: Session) -> None:
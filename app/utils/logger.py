@@ -8,6 +8,7 @@ import pathlib
 import logging
 import sys
 
+from functools import lru_cache
 from logging.handlers import TimedRotatingFileHandler
 from uvicorn.logging import ColourizedFormatter
 
@@ -17,9 +18,11 @@ FORMATTER = logging.Formatter(
 LOG_FILE = "logs/app.log"
 
 
+@lru_cache(maxsize=None)
 def get_console_handler():
     """
     Create and return a console log handler with colorized output.
+    The handler is created once and shared by every logger.
     Returns:
         logging.StreamHandler: Configured console handler.
     """
@@ -34,18 +37,27 @@ def get_console_handler():
     return console_handler
 
 
-def get_file_handler():
+def get_file_handler(log_file=None):
     """
     Create and return a file log handler with daily rotation.
-    Ensures the logs directory exists.
+    Ensures the logs directory exists. One handler is shared per log file.
+    Args:
+        log_file (str, optional): Path of the log file. Defaults to LOG_FILE.
     Returns:
         TimedRotatingFileHandler: Configured file handler.
     """
+    # Resolve the default before the cached lookup so None and LOG_FILE
+    # share a handler
+    return _get_file_handler(log_file or LOG_FILE)
+
+
+@lru_cache(maxsize=None)
+def _get_file_handler(log_file):
     logs_dir_path = pathlib.Path().resolve().joinpath("logs")
     if not logs_dir_path.exists():
         logs_dir_path.mkdir(exist_ok=True)
     file_handler = TimedRotatingFileHandler(
-        LOG_FILE, when="midnight", backupCount=7
+        log_file, when="midnight", backupCount=7
     )
     file_handler.setFormatter(FORMATTER)
     return file_handler
@@ -54,14 +66,18 @@ def get_file_handler():
 def get_logger(logger_name):
     """
     Return a configured logger instance with console and file handlers.
+    Handlers are only attached the first time a given logger is requested,
+    so repeated calls do not duplicate log output.
     Args:
         logger_name (str): Name of the logger (usually __name__).
     Returns:
         logging.Logger: Configured logger instance.
     """
     logger = logging.getLogger(logger_name)
+    if logger.handlers:
+        return logger
     logger.setLevel(logging.DEBUG)
     logger.addHandler(get_console_handler())
-    logger.addHandler(get_file_handler())
+    logger.addHandler(get_file_handler(LOG_FILE))
     logger.propagate = False
     return logger
@@ -5,6 +5,7 @@ This module provides secure password hashing and verification using industry-sta
 algorithms without relying on deprecated modules.
 """
 
+import asyncio
 import hashlib
 import secrets
 import base64
@@ -24,12 +25,13 @@ def generate_salt() -> str:
     return secrets.token_urlsafe(SALT_LENGTH)
 
 
-def hash_password(password: str) -> str:
+def hash_password(password: str, iterations: int = ITERATIONS) -> str:
     """
     Hash a password using PBKDF2 with SHA256.
 
     Args:
         password: Plain text password to hash
+        iterations: PBKDF2 iteration count (work factor)
 
     Returns:
         Hashed password string in format: algorithm$iterations$salt$hash
@@ -50,14 +52,14 @@ def hash_password(password: str) -> str:
         HASH_ALGORITHM,
         password.encode("utf-8"),
         salt.encode("utf-8"),
-        ITERATIONS,
+        iterations,
     )
 
     # Encode hash as base64
     hash_b64 = base64.b64encode(hash_obj).decode("utf-8")
 
     # Return in format: algorithm$iterations$salt$hash
-    return f"{HASH_ALGORITHM}${ITERATIONS}${salt}${hash_b64}"
+    return f"{HASH_ALGORITHM}${iterations}${salt}${hash_b64}"
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -113,6 +115,32 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         return False
 
 
+async def hash_password_async(password: str) -> str:
+    """
+    Hash a password in the default executor.
+
+    Use from ``async def`` code so PBKDF2 does not block the event loop.
+    Sync route handlers already run in FastAPI's threadpool and should call
+    ``hash_password`` directly.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, hash_password, password)
+
+
+async def verify_password_async(
+    plain_password: str, hashed_password: str
+) -> bool:
+    """
+    Verify a password in the default executor.
+
+    Async counterpart of ``verify_password``; see ``hash_password_async``.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        None, verify_password, plain_password, hashed_password
+    )
+
+
 def needs_rehash(hashed_password: str) -> bool:
     """
     Check if a password hash needs to be rehashed (e.g., due to algorithm updates).
@@ -4,63 +4,119 @@ Request logging middleware for GuildRoster.
 Provides enhanced logging with frontend context information.
 """
 
+import logging
 import time
-from typing import Callable
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Health/asset paths that are only logged at DEBUG level
+QUIET_PATHS = frozenset({"/", "/health", "/metrics", "/favicon.ico"})
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+
+def _is_quiet_path(path: str) -> bool:
+    """Check whether a request path should skip INFO-level logging."""
+    return path.startswith("/static") or path in QUIET_PATHS
+
+
+def _decode_header(value: bytes) -> str:
+    """Decode a raw header value, falling back to "Unknown" when missing."""
+    return value.decode("latin-1") if value else "Unknown"
+
+
+class RequestLoggingMiddleware:
     """Middleware to log request details with frontend context."""
 
-    def __init__(self, app, include_headers: bool = True):
-        super().__init__(app)
+    def __init__(self, app: ASGIApp, include_headers: bool = True):
+        self.app = app
         self.include_headers = include_headers
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        start_time = time.time()
-
-        # Extract context information
-        user_agent = request.headers.get("user-agent", "Unknown")
-        referer = request.headers.get("referer", "Unknown")
-        frontend_route = request.headers.get("x-frontend-route", "Unknown")
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        method = scope["method"]
+        path = scope["path"]
+
+        # Extract context information in a single pass over the raw headers
+        user_agent = referer = frontend_route = b""
+        for name, value in scope["headers"]:
+            if name == b"user-agent":
+                user_agent = value
+            elif name == b"referer":
+                referer = value
+            elif name == b"x-frontend-route":
+                frontend_route = value
 
         # Determine if this is a frontend request
-        is_frontend = "GuildRoster-Frontend" in user_agent
+        is_frontend = b"GuildRoster-Frontend" in user_agent
 
-        # Log request start
-        log_message = f"Request: {request.method} {request.url.path}"
         if is_frontend:
-            log_message += (
-                f" | Frontend Route: {frontend_route} | Referer: {referer}"
-            )
-
-        logger.info(log_message)
+            # Only frontend requests need the context decoded
+            frontend_route = _decode_header(frontend_route)
+
+        # Log request start (skipped entirely for quiet paths)
+        quiet = _is_quiet_path(path)
+        if not quiet:
+            if is_frontend:
+                logger.info(
+                    "Request: %s %s | Frontend Route: %s | Referer: %s",
+                    method,
+                    path,
+                    frontend_route,
+                    _decode_header(referer),
+                )
+            else:
+                logger.info("Request: %s %s", method, path)
+
+        status_code = 500
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
         # Process the request
-        response = await call_next(request)
+        await self.app(scope, receive, send_wrapper)
 
         # Calculate processing time
-        process_time = time.time() - start_time
-
-        # Log response
-        status_code = response.status_code
-        log_message = f"Response: {request.method} {request.url.path} -> {status_code} ({process_time:.3f}s)"
-        if is_frontend:
-            log_message += f" | Frontend Route: {frontend_route}"
+        process_time = time.perf_counter() - start_time
 
         # Use different log levels based on status code
         if status_code >= 500:
-            logger.error(log_message)
+            level = logging.ERROR
         elif status_code >= 400:
-            logger.warning(log_message)
+            level = logging.WARNING
+        elif quiet:
+            level = logging.DEBUG
         else:
-            logger.info(log_message)
+            level = logging.INFO
 
-        return response
+        # Log response
+        if is_frontend:
+            logger.log(
+                level,
+                "Response: %s %s -> %d (%.3fs) | Frontend Route: %s",
+                method,
+                path,
+                status_code,
+                process_time,
+                frontend_route,
+            )
+        else:
+            logger.log(
+                level,
+                "Response: %s %s -> %d (%.3fs)",
+                method,
+                path,
+                status_code,
+                process_time,
+            )
 
 
 def log_request_context(request: Request, message: str = ""):
@@ -77,12 +133,13 @@ def log_request_context(request: Request, message: str = ""):
 
     is_frontend = "GuildRoster-Frontend" in user_agent
 
-    log_message = f"Route Context: {request.method} {request.url.path}"
+    log_format = "Route Context: %s %s"
+    args = [request.method, request.url.path]
     if message:
-        log_message += f" | {message}"
+        log_format += " | %s"
+        args.append(message)
     if is_frontend:
-        log_message += (
-            f" | Frontend Route: {frontend_route} | Referer: {referer}"
-        )
+        log_format += " | Frontend Route: %s | Referer: %s"
+        args.extend([frontend_route, referer])
 
-    logger.info(log_message)
+    logger.info(log_format, *args)
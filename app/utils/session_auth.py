@@ -1,40 +1,113 @@
 from fastapi import Depends, HTTPException, status, Request
-from sqlalchemy.orm import Session
-from typing import Optional
+from sqlalchemy import bindparam, inspect, select
+from sqlalchemy.orm import Session, make_transient_to_detached
+from typing import Any, Dict, Optional, Tuple
 
 from app.database import get_db
 from app.models.session import Session as SessionModel
 from app.models.user import User
+from app.utils.cache import TTLCache
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Column snapshots of valid (session, user) pairs keyed by session ID, so
+# repeat requests from the same browser skip the database. The TTL bounds
+# how long a permission change can go unnoticed.
+#
+# The cache is per process: logout, update_user and delete_user evict
+# entries here, but a session deleted or deactivated anywhere else
+# (expiry cleanup, another worker) stays cached until the TTL runs out.
+# For multi-worker deployments, replace with Redis.
+_session_cache = TTLCache(maxsize=10_000, ttl=60)
 
-def get_session_from_cookie(
+# Built once so every lookup reuses the same statement and its compiled
+# form from the engine's query cache
+_SESSION_AND_USER_BY_ID = (
+    select(SessionModel, User)
+    .outerjoin(User, SessionModel.user_id == User.id)
+    .where(SessionModel.session_id == bindparam("session_id"))
+)
+
+
+def _snapshot(instance) -> Dict[str, Any]:
+    """Copy the column values of a loaded model instance."""
+    return {
+        attr.key: getattr(instance, attr.key)
+        for attr in inspect(instance).mapper.column_attrs
+    }
+
+
+def _restore(db: Session, model, columns: Dict[str, Any]):
+    """Attach a cached snapshot to the database session without a query."""
+    instance = model(**columns)
+    make_transient_to_detached(instance)
+    return db.merge(instance, load=False)
+
+
+def invalidate_session(session_id: str):
+    """Drop a session from the lookup cache, e.g. on logout."""
+    _session_cache.pop(session_id)
+
+
+def clear_session_cache():
+    """Drop all cached sessions, e.g. after a user is changed or deleted."""
+    _session_cache.clear()
+
+
+def get_session_and_user_from_cookie(
     request: Request, db: Session = Depends(get_db)
-) -> Optional[SessionModel]:
-    """Get session from session cookie."""
+) -> Optional[Tuple[SessionModel, Optional[User]]]:
+    """
+    Get the session and its user from the session cookie in one query.
+
+    The pair is stored on request.state so dependencies resolved later in
+    the same request reuse it instead of querying again.
+    """
+    auth_pair = getattr(request.state, "auth_pair", None)
+    if auth_pair is not None:
+        return auth_pair
+
     session_id = request.cookies.get("session_id")
-    logger.debug(f"Session ID from cookie: {session_id}")
+    logger.debug("Session ID from cookie: %s", session_id)
     if not session_id:
         logger.debug("No session ID found in cookie")
         return None
 
-    session = (
-        db.query(SessionModel)
-        .filter(SessionModel.session_id == session_id)
-        .first()
-    )
-    if not session:
+    cached = _session_cache.get(session_id)
+    if cached is not None:
+        session = _restore(db, SessionModel, cached[0])
+        if session.is_valid():
+            user = _restore(db, User, cached[1])
+            request.state.auth_pair = (session, user)
+            return session, user
+        invalidate_session(session_id)
+
+    row = db.execute(
+        _SESSION_AND_USER_BY_ID, {"session_id": session_id}
+    ).first()
+    if not row:
         logger.debug("No session found in database")
         return None
 
+    session, user = row
     if not session.is_valid():
         logger.debug("Session is invalid")
         return None
 
-    logger.debug(f"Valid session found: user_id={session.user_id}")
-    return session
+    logger.debug("Valid session found: user_id=%s", session.user_id)
+    if user is not None and user.is_active is not False:
+        _session_cache.set(session_id, (_snapshot(session), _snapshot(user)))
+    request.state.auth_pair = (session, user)
+    return session, user
+
+
+def get_session_from_cookie(
+    request: Request, db: Session = Depends(get_db)
+) -> Optional[SessionModel]:
+    """Get session from session cookie."""
+    auth_pair = get_session_and_user_from_cookie(request, db)
+    return auth_pair[0] if auth_pair else None
 
 
 def get_current_session(
@@ -42,22 +115,27 @@ def get_current_session(
     db: Session = Depends(get_db),
 ) -> SessionModel:
     """Get the current session from cookie."""
-    session = get_session_from_cookie(request, db)
-    if not session:
+    auth_pair = get_session_and_user_from_cookie(request, db)
+    if not auth_pair:
         logger.debug("No valid session found, raising 401")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Not authenticated",
         )
-    return session
+    return auth_pair[0]
 
 
 def get_current_user(
+    request: Request,
     session: SessionModel = Depends(get_current_session),
     db: Session = Depends(get_db),
 ) -> User:
     """Get the current user from the session."""
-    user = db.query(User).filter(User.id == session.user_id).first()
+    auth_pair = getattr(request.state, "auth_pair", None)
+    if auth_pair is not None and auth_pair[0] is session:
+        user = auth_pair[1]
+    else:
+        user = db.query(User).filter(User.id == session.user_id).first()
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -80,13 +158,13 @@ def require_user(user: User = Depends(get_current_user)) -> User:
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Authentication required",
         )
-    logger.debug(f"require_user called with user: {user.username}")
+    logger.debug("require_user called with user: %s", user.username)
     return user
 
 
 def require_superuser(user: User = Depends(require_user)) -> User:
     """Require a superuser session."""
-    logger.debug(f"require_superuser called with user: {user.username}")
+    logger.debug("require_superuser called with user: %s", user.username)
     if user.is_superuser is False:
         logger.debug("User is not superuser, raising 403")
         raise HTTPException(
@@ -1,9 +1,173 @@
+"""
+WarcraftLogs v2 API client and report processing helpers.
+
+The client is synchronous. It is only called from regular ``def`` route
+handlers, which FastAPI runs in its threadpool, so blocking network I/O
+here does not stall the event loop.
+"""
+
+import atexit
+import copy
+import orjson
+import random
 import requests
+import threading
 import time
 import re
-from typing import Optional, Dict, List, Tuple
-from difflib import SequenceMatcher
+from typing import Any, Optional, Dict, List, Tuple
+from rapidfuzz import fuzz, process
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from app.config import settings
+from app.utils.cache import TTLCache
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Matches the report code in a WarcraftLogs report URL
+_REPORT_CODE_RE = re.compile(r"/reports/([a-zA-Z0-9]+)")
+
+# Anything that isn't a word character, whitespace included
+_NON_WORD_RE = re.compile(r"\W+")
+
+# WarcraftLogs class names indexed by class ID (the actual IDs used by
+# WarcraftLogs); index 0 is unused
+_CLASS_NAMES = (
+    "Unknown",
+    "Death Knight",
+    "Druid",
+    "Hunter",
+    "Mage",
+    "Monk",
+    "Paladin",
+    "Priest",
+    "Rogue",
+    "Shaman",
+    "Warlock",
+    "Warrior",
+)
+
+# (connect, read) timeouts in seconds for WarcraftLogs calls, so a hung
+# upstream can't tie up a threadpool worker indefinitely
+_REQUEST_TIMEOUT = (3.05, 15)
+
+# Longest wait honoured from a Retry-After header, in seconds. A 429 can
+# ask for minutes, which would hold a threadpool worker that long.
+_MAX_RETRY_AFTER = 10
+
+
+class _CappedRetry(Retry):
+    """Retry policy that caps the Retry-After wait at _MAX_RETRY_AFTER."""
+
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, _MAX_RETRY_AFTER)
+
+
+# Reports that ended this recently may still be live-logging, so their
+# cached data is only kept briefly
+_LIVE_REPORT_WINDOW_MS = 15 * 60 * 1000
+_LIVE_REPORT_CACHE_TTL = 60
+
+# GraphQL queries for a single report; the report code is passed as a
+# variable so the query text stays constant
+_METADATA_QUERY = """
+query Report($code: String!) {
+    reportData {
+        report(code: $code) {
+            title
+            startTime
+            endTime
+            owner { name }
+            zone { name }
+        }
+    }
+}
+"""
+
+_RANKED_CHARACTERS_QUERY = """
+query Report($code: String!) {
+    reportData {
+        report(code: $code) {
+            title
+            startTime
+            endTime
+            rankedCharacters {
+                id
+                canonicalID
+                name
+                classID
+            }
+        }
+    }
+}
+"""
+
+_MASTER_DATA_QUERY = """
+query Report($code: String!) {
+    reportData {
+        report(code: $code) {
+            title
+            startTime
+            endTime
+            masterData(translate: true) {
+                actors(type: "Player") {
+                    id
+                    gameID
+                    server
+                    subType
+                    name
+                }
+            }
+        }
+    }
+}
+"""
+
+_FIGHTS_QUERY = """
+query Report($code: String!) {
+    reportData {
+        report(code: $code) {
+            endTime
+            fights {
+                id
+                name
+                startTime
+                endTime
+                difficulty
+                kill
+                encounterID
+                averageItemLevel
+                bossPercentage
+            }
+        }
+    }
+}
+"""
+
+# Report fields selected when fetching metadata, participants and fights
+# together in a single request
+_REPORT_BUNDLE_FIELDS = """
+    title
+    startTime
+    endTime
+    owner { name }
+    zone { name }
+    rankedCharacters { id canonicalID name classID }
+    fights {
+        id
+        name
+        startTime
+        endTime
+        difficulty
+        kill
+        encounterID
+        averageItemLevel
+        bossPercentage
+    }
+"""
 
 
 class WarcraftLogsAPI:
@@ -19,17 +183,87 @@ class WarcraftLogsAPI:
         self.api_url = settings.WARCRAFTLOGS_API_URL
         self._access_token = None
         self._token_expires_at = 0
+        self._token_lock = threading.Lock()
+        # Number of successful token refreshes, for monitoring
+        self.token_refresh_count = 0
+        self._session = self._create_session()
+        # Finished reports don't change, so cache lookups per report code.
+        # Failed lookups (None) are never cached.
+        self._meta_cache = TTLCache(maxsize=512, ttl=3600)
+        self._participants_cache = TTLCache(maxsize=512, ttl=3600)
+        self._fights_cache = TTLCache(maxsize=512, ttl=1800)
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """
+        Create a pooled HTTP session so requests to WarcraftLogs reuse
+        keep-alive connections instead of a new TLS handshake per call.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            # GraphQL queries and the token request are safe to repeat, so
+            # POSTs are retried too. Read timeouts are retried only once to
+            # bound how long a hung upstream can hold a worker.
+            max_retries=_CappedRetry(
+                total=5,
+                read=1,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset(["POST"]),
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def close(self):
+        """Close pooled connections held by the HTTP session."""
+        self._session.close()
+
+    def invalidate_report(self, report_code: str):
+        """Drop all cached data for a report so the next lookup refetches."""
+        self._meta_cache.pop(report_code)
+        self._participants_cache.pop(report_code)
+        self._fights_cache.pop(report_code)
+
+    @staticmethod
+    def _report_cache_ttl(metadata: Dict) -> Optional[float]:
+        """
+        Cache TTL for a report's data: the cache default for finished
+        reports, or a short TTL if the report may still be in progress.
+        """
+        end_time = metadata.get("endTime")
+        if end_time is None:
+            return _LIVE_REPORT_CACHE_TTL
+        if time.time() * 1000 - end_time < _LIVE_REPORT_WINDOW_MS:
+            return _LIVE_REPORT_CACHE_TTL
+        return None
 
     def _get_access_token(self) -> Optional[str]:
         """
         Get a valid access token using client credentials flow.
-        Caches the token until it expires.
+        Caches the token until it expires. Concurrent callers share a
+        single refresh instead of each requesting a new token.
         """
         # Return cached token if still valid
         if self._access_token and time.time() < self._token_expires_at:
             return self._access_token
 
-        # Request new token
+        with self._token_lock:
+            # Another thread may have refreshed while we waited for the lock
+            if self._access_token and time.time() < self._token_expires_at:
+                return self._access_token
+            return self._request_access_token()
+
+    def _request_access_token(self) -> Optional[str]:
+        """
+        Request a new access token from the OAuth endpoint.
+        Must be called while holding the token lock.
+        """
         token_data = {
             "grant_type": "client_credentials",
             "client_id": self.client_id,
@@ -37,21 +271,38 @@ class WarcraftLogsAPI:
         }
 
         try:
-            response = requests.post(self.token_url, data=token_data)
+            response = self._session.post(
+                self.token_url, data=token_data, timeout=_REQUEST_TIMEOUT
+            )
             response.raise_for_status()
 
-            token_info = response.json()
+            token_info = orjson.loads(response.content)
             self._access_token = token_info["access_token"]
-            # Set expiration time (subtract 60 seconds for safety)
-            self._token_expires_at = time.time() + token_info["expires_in"] - 60
+            # Set expiration time (subtract 60 seconds for safety, plus a
+            # little jitter so workers don't all refresh at the same moment)
+            self._token_expires_at = (
+                time.time()
+                + token_info["expires_in"]
+                - 60
+                - random.uniform(0, 30)
+            )
+            self.token_refresh_count += 1
 
             return self._access_token
 
-        except requests.exceptions.RequestException as e:
-            print(f"Failed to get WarcraftLogs access token: {e}")
+        except requests.exceptions.Timeout as e:
+            logger.warning("Timed out getting WarcraftLogs access token: %s", e)
+            return None
+        except (
+            requests.exceptions.RequestException,
+            orjson.JSONDecodeError,
+        ) as e:
+            logger.error("Failed to get WarcraftLogs access token: %s", e)
             return None
 
-    def _make_api_request(self, query: str) -> Optional[Dict]:
+    def _make_api_request(
+        self, query: str, variables: Optional[Dict] = None
+    ) -> Optional[Dict]:
         """
         Make a GraphQL request to the WarcraftLogs API.
         """
@@ -59,43 +310,76 @@ class WarcraftLogsAPI:
         if not access_token:
             return None
 
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-        }
+        payload: Dict = {"query": query}
+        if variables:
+            payload["variables"] = variables
+        body = orjson.dumps(payload)
 
         try:
-            response = requests.post(
-                self.api_url, json={"query": query}, headers=headers
-            )
+            response = self._post_graphql(body, access_token)
+            if response.status_code == 401:
+                # The cached token was rejected before its expiry; refresh
+                # it and retry once
+                self._invalidate_access_token(access_token)
+                access_token = self._get_access_token()
+                if not access_token:
+                    return None
+                response = self._post_graphql(body, access_token)
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
 
-        except requests.exceptions.RequestException as e:
-            print(f"WarcraftLogs API request failed: {e}")
+        except requests.exceptions.Timeout as e:
+            logger.warning("WarcraftLogs API request timed out: %s", e)
+            return None
+        except (
+            requests.exceptions.RequestException,
+            orjson.JSONDecodeError,
+        ) as e:
+            logger.error("WarcraftLogs API request failed: %s", e)
             return None
 
+    def _post_graphql(self, body: bytes, access_token: str) -> requests.Response:
+        """POST an encoded GraphQL payload with the given access token."""
+        return self._session.post(
+            self.api_url,
+            data=body,
+            headers={
+                "Authorization": f"Bearer {access_token}",
+                "Content-Type": "application/json",
+            },
+            timeout=_REQUEST_TIMEOUT,
+        )
+
+    def _invalidate_access_token(self, rejected_token: str):
+        """
+        Drop the cached token after the API rejected it, unless another
+        thread has already replaced it.
+        """
+        with self._token_lock:
+            if self._access_token == rejected_token:
+                self._access_token = None
+                self._token_expires_at = 0
+
     def get_report_metadata(self, report_code: str) -> Optional[Dict]:
         """
         Fetch basic metadata for a WarcraftLogs report.
         """
-        query = f"""
-        query {{
-            reportData {{
-                report(code: "{report_code}") {{
-                    title
-                    startTime
-                    endTime
-                    owner {{ name }}
-                    zone {{ name }}
-                }}
-            }}
-        }}
-        """
-
-        result = self._make_api_request(query)
+        cached = self._meta_cache.get(report_code)
+        if cached is not None:
+            return cached
+
+        result = self._make_api_request(
+            _METADATA_QUERY, {"code": report_code}
+        )
         if result and "data" in result:
-            return result["data"]["reportData"]["report"]
+            metadata = result["data"]["reportData"]["report"]
+            if metadata is not None:
+                self._meta_cache.set(
+                    report_code,
+                    copy.deepcopy(metadata),
+                    ttl=self._report_cache_ttl(metadata),
+                )
+            return metadata
         return None
 
     def get_report_participants(self, report_code: str) -> Optional[List[Dict]]:
@@ -104,122 +388,93 @@ class WarcraftLogsAPI:
         First tries rankedCharacters, falls back to masterData if rankedCharacters is None.
         Converts classID to class names using WarcraftLogs class ID mappings.
         """
+        cached = self._participants_cache.get(report_code)
+        if cached is not None:
+            return cached
+
         # First attempt: try rankedCharacters
-        participants = self._get_participants_ranked_characters(report_code)
+        report_data = self._fetch_report(_RANKED_CHARACTERS_QUERY, report_code)
+        participants = (
+            self._convert_ranked_characters(report_data.get("rankedCharacters"))
+            if report_data
+            else None
+        )
         used_fallback = False
         
         # If rankedCharacters failed or returned None, try masterData
         if not participants:
-            participants = self._get_participants_master_data(report_code)
+            fallback_data = self._fetch_report(_MASTER_DATA_QUERY, report_code)
+            participants = self._convert_master_data(fallback_data)
+            report_data = fallback_data or report_data
             used_fallback = True
         
         # Add metadata about which method was used
         if participants:
             for participant in participants:
                 participant["_used_fallback_method"] = used_fallback
-        
+            self._participants_cache.set(
+                report_code,
+                copy.deepcopy(participants),
+                ttl=self._report_cache_ttl(report_data),
+            )
+
         return participants
 
-    def _get_participants_ranked_characters(self, report_code: str) -> Optional[List[Dict]]:
-        """
-        Fetch participants using rankedCharacters query.
-        """
-        query = f"""
-        query {{
-            reportData {{
-                report(code: "{report_code}") {{
-                    title
-                    startTime
-                    endTime
-                    rankedCharacters {{
-                        id
-                        canonicalID
-                        name
-                        classID
-                    }}
-                }}
-            }}
-        }}
-        """
-
-        result = self._make_api_request(query)
+    def _fetch_report(self, query: str, report_code: str) -> Optional[Dict]:
+        """
+        Run a single-report query and return the report object, or None if
+        the request failed or the report doesn't exist.
+        """
+        result = self._make_api_request(query, {"code": report_code})
         if not result or "data" not in result:
             return None
+        return result["data"]["reportData"]["report"]
 
-        report_data = result["data"]["reportData"]["report"]
-        if not report_data:
-            return None
-
-        ranked_characters = report_data.get("rankedCharacters")
-        
+    @staticmethod
+    def _convert_ranked_characters(
+        ranked_characters: Optional[List[Dict]],
+    ) -> Optional[List[Dict]]:
+        """
+        Convert rankedCharacters entries into participant dictionaries.
+        """
         # Check if rankedCharacters is None or empty
         if not ranked_characters:
             return None
 
-        # Convert classID to class name for better usability
-        # WarcraftLogs class ID mappings (these are the actual IDs used by WarcraftLogs)
-        class_names = {
-            1: "Death Knight",
-            2: "Druid",
-            3: "Hunter",
-            4: "Mage",
-            5: "Monk",
-            6: "Paladin",
-            7: "Priest",
-            8: "Rogue",
-            9: "Shaman",
-            10: "Warlock",
-            11: "Warrior",
-        }
-
-        participants = []
-        for character in ranked_characters:
-            class_id = character.get("classID")
-            class_name = class_names.get(class_id, "Unknown")
-
-            participant = {
+        class_names = _CLASS_NAMES
+        class_count = len(class_names)
+        return [
+            {
                 "id": character.get("id"),
                 "canonicalID": character.get("canonicalID"),
                 "name": character.get("name"),
-                "class": class_name,
-                "classID": character.get("classID"),
+                "class": (
+                    class_names[class_id]
+                    if isinstance(class_id, int) and 0 <= class_id < class_count
+                    else "Unknown"
+                ),
+                "classID": class_id,
                 "role": "DPS",  # Default role
             }
-            participants.append(participant)
-
-        return participants
+            for character in ranked_characters
+            for class_id in (character.get("classID"),)
+        ]
 
     def _get_participants_master_data(self, report_code: str) -> Optional[List[Dict]]:
         """
         Fetch participants using masterData query as fallback.
         This is used when rankedCharacters returns None.
         """
-        query = f"""
-        query {{
-            reportData {{
-                report(code: "{report_code}") {{
-                    title
-                    startTime
-                    endTime
-                    masterData(translate: true) {{
-                        actors(type: "Player") {{
-                            id
-                            gameID
-                            server
-                            subType
-                            name
-                        }}
-                    }}
-                }}
-            }}
-        }}
-        """
-
-        result = self._make_api_request(query)
-        if not result or "data" not in result:
-            return None
+        return self._convert_master_data(
+            self._fetch_report(_MASTER_DATA_QUERY, report_code)
+        )
 
-        report_data = result["data"]["reportData"]["report"]
+    @staticmethod
+    def _convert_master_data(report_data: Optional[Dict]) -> Optional[List[Dict]]:
+        """
+        Convert a report's masterData player actors into participant
+        dictionaries.
+        """
         if not report_data:
             return None
 
@@ -254,39 +509,124 @@ class WarcraftLogsAPI:
         Fetch all fights from a WarcraftLogs report.
         This can be useful for understanding raid progression and attendance.
         """
-        query = f"""
-        query {{
-            reportData {{
-                report(code: "{report_code}") {{
-                    fights {{
-                        id
-                        name
-                        startTime
-                        endTime
-                        difficulty
-                        kill
-                        encounterID
-                        averageItemLevel
-                        bossPercentage
-                    }}
-                }}
-            }}
-        }}
-        """
-
-        result = self._make_api_request(query)
-        if not result or "data" not in result:
-            return None
+        cached = self._fights_cache.get(report_code)
+        if cached is not None:
+            return cached
 
-        report_data = result["data"]["reportData"]["report"]
+        report_data = self._fetch_report(_FIGHTS_QUERY, report_code)
         if not report_data:
             return None
 
-        return report_data.get("fights", [])
+        fights = report_data.get("fights", [])
+        if fights is not None:
+            self._fights_cache.set(
+                report_code,
+                copy.deepcopy(fights),
+                ttl=self._report_cache_ttl(report_data),
+            )
+        return fights
+
+    def get_report_bundle(self, report_code: str) -> Optional[Dict]:
+        """
+        Fetch metadata, participants and fights for a report in one request.
+        Returns a dict with "metadata", "participants" and "fights" keys,
+        or None if the report could not be fetched.
+        """
+        return self.get_report_bundles([report_code]).get(report_code)
+
+    def get_report_bundles(
+        self, report_codes: List[str]
+    ) -> Dict[str, Optional[Dict]]:
+        """
+        Fetch metadata, participants and fights for several reports.
+        All reports not already cached are fetched with a single GraphQL
+        query using one aliased report field per code.
+        """
+        bundles: Dict[str, Optional[Dict]] = {}
+        to_fetch = []
+        for report_code in dict.fromkeys(report_codes):
+            metadata = self._meta_cache.get(report_code)
+            participants = self._participants_cache.get(report_code)
+            fights = self._fights_cache.get(report_code)
+            if None in (metadata, participants, fights):
+                to_fetch.append(report_code)
+            else:
+                bundles[report_code] = {
+                    "metadata": metadata,
+                    "participants": participants,
+                    "fights": fights,
+                }
+
+        if not to_fetch:
+            return bundles
+
+        params = ", ".join(f"$c{i}: String!" for i in range(len(to_fetch)))
+        aliases = "\n".join(
+            f"r{i}: report(code: $c{i}) {{ {_REPORT_BUNDLE_FIELDS} }}"
+            for i in range(len(to_fetch))
+        )
+        query = f"query Reports({params}) {{ reportData {{ {aliases} }} }}"
+        variables = {f"c{i}": code for i, code in enumerate(to_fetch)}
+
+        result = self._make_api_request(query, variables)
+        report_data = None
+        if result and result.get("data"):
+            report_data = result["data"].get("reportData")
+
+        for i, report_code in enumerate(to_fetch):
+            report = report_data.get(f"r{i}") if report_data else None
+            bundles[report_code] = (
+                self._split_report_bundle(report_code, report)
+                if report
+                else None
+            )
+
+        return bundles
+
+    def _split_report_bundle(self, report_code: str, report: Dict) -> Dict:
+        """
+        Split a combined report response into metadata, participants and
+        fights, populating the per-report caches.
+        """
+        metadata = {
+            key: report.get(key)
+            for key in ("title", "startTime", "endTime", "owner", "zone")
+        }
+        ttl = self._report_cache_ttl(metadata)
+        self._meta_cache.set(report_code, copy.deepcopy(metadata), ttl=ttl)
+
+        participants = self._convert_ranked_characters(
+            report.get("rankedCharacters")
+        )
+        used_fallback = False
+        if not participants:
+            participants = self._get_participants_master_data(report_code)
+            used_fallback = True
+        if participants:
+            for participant in participants:
+                participant["_used_fallback_method"] = used_fallback
+            self._participants_cache.set(
+                report_code, copy.deepcopy(participants), ttl=ttl
+            )
+
+        fights = report.get("fights", [])
+        if fights is not None:
+            self._fights_cache.set(
+                report_code, copy.deepcopy(fights), ttl=ttl
+            )
+
+        return {
+            "metadata": metadata,
+            "participants": participants,
+            "fights": fights,
+        }
 
 
 # Global API client instance
 warcraftlogs_api = WarcraftLogsAPI()
+# The app lifespan closes it on shutdown; this covers scripts and other
+# processes that import the client without running the app
+atexit.register(warcraftlogs_api.close)
 
 
 def extract_report_code(url: str) -> Optional[str]:
@@ -294,16 +634,12 @@ def extract_report_code(url: str) -> Optional[str]:
     Extract the report code from a WarcraftLogs report URL.
     Example: https://www.warcraftlogs.com/reports/abc123 -> 'abc123'
     """
-    import re
-
     # Handle None or empty URLs
     if not url:
         return None
 
-    match = re.search(r"/reports/([a-zA-Z0-9]+)", url)
-    if match:
-        return match.group(1)
-    return None
+    match = _REPORT_CODE_RE.search(url)
+    return match.group(1) if match else None
 
 
 def fetch_report_metadata(
@@ -331,16 +667,56 @@ def fetch_report_participants(report_code: str) -> Optional[List[Dict]]:
     return warcraftlogs_api.get_report_participants(report_code)
 
 
+def fetch_report_fights(report_code: str) -> Optional[List[Dict]]:
+    """
+    Fetch all fights from a WarcraftLogs report.
+    This can be useful for understanding raid progression and attendance.
+    """
+    return warcraftlogs_api.get_report_fights(report_code)
+
+
 def normalize_username(username: str) -> str:
     """
     Normalize a WoW username for comparison by removing special characters and converting to lowercase.
     This helps with fuzzy matching of usernames that may have different special character representations.
     """
-    # Remove common special characters and convert to lowercase
-    normalized = re.sub(r"[^\w\s]", "", username.lower())
-    # Remove extra whitespace
-    normalized = re.sub(r"\s+", "", normalized)
-    return normalized
+    # Strip special characters and whitespace in a single pass
+    return _NON_WORD_RE.sub("", username.lower())
+
+
+def fuzzy_match_normalized(
+    target_normalized: str,
+    normalized_candidates: List[Tuple[str, Any]],
+    threshold: float = 0.8,
+) -> Optional[Any]:
+    """
+    Find the best fuzzy match among candidates whose names are already
+    normalized.
+
+    Args:
+        target_normalized: The normalized username to match
+        normalized_candidates: (normalized name, item) pairs to match against
+        threshold: Minimum similarity score (0.0 to 1.0) to consider a match
+
+    Returns:
+        The item paired with the best matching name if above threshold,
+        None otherwise
+    """
+    if not normalized_candidates:
+        return None
+
+    # rapidfuzz scores on a 0-100 scale
+    match = process.extractOne(
+        target_normalized,
+        [name for name, _ in normalized_candidates],
+        scorer=fuzz.ratio,
+        score_cutoff=threshold * 100,
+    )
+    if match is None:
+        return None
+
+    _, _, index = match
+    return normalized_candidates[index][1]
 
 
 def fuzzy_match_username(
@@ -357,26 +733,11 @@ def fuzzy_match_username(
     Returns:
         The best matching username if above threshold, None otherwise
     """
-    if not candidate_names:
-        return None
-
-    target_normalized = normalize_username(target_name)
-    best_match = None
-    best_score = 0.0
-
-    for candidate in candidate_names:
-        candidate_normalized = normalize_username(candidate)
-
-        # Use SequenceMatcher for fuzzy string matching
-        score = SequenceMatcher(
-            None, target_normalized, candidate_normalized
-        ).ratio()
-
-        if score > best_score and score >= threshold:
-            best_score = score
-            best_match = candidate
-
-    return best_match
+    return fuzzy_match_normalized(
+        normalize_username(target_name),
+        [(normalize_username(name), name) for name in candidate_names],
+        threshold,
+    )
 
 
 def match_participants_to_toons(
@@ -395,41 +756,60 @@ def match_participants_to_toons(
     Returns:
         Tuple of (matched_participants, unmatched_team_toons, unknown_participants)
     """
+    if not team_toons:
+        # Nothing to match against; every participant is unknown
+        return (
+            [],
+            [],
+            [
+                {
+                    "participant": participant,
+                    "suggested_member": None,
+                    "notes": f"Unknown participant: {participant.get('name', '')}",
+                }
+                for participant in participants
+            ],
+        )
+
     matched_participants = []
-    unmatched_team_toons = team_toons.copy()
     unknown_participants = []
+    # IDs of team toons not yet matched to a participant
+    remaining_ids = {toon["id"] for toon in team_toons}
+
+    # Normalize each team toon's username once up front
+    normalized_toons = [
+        (normalize_username(toon["username"]), toon) for toon in team_toons
+    ]
 
-    # Create a mapping of normalized usernames to toon data
-    toon_map = {}
-    for toon in team_toons:
-        normalized_name = normalize_username(toon["username"])
-        toon_map[normalized_name] = toon
+    # Create a mapping of normalized usernames to toon data. The first toon
+    # wins if several normalize the same; the rest fall through to fuzzy
+    # matching.
+    toon_map: Dict[str, Dict] = {}
+    for normalized_name, toon in normalized_toons:
+        toon_map.setdefault(normalized_name, toon)
 
     # Match participants to toons
     for participant in participants:
         participant_name = participant.get("name", "")
-        matched_toon = None
+        participant_normalized = normalize_username(participant_name)
 
-        # First try exact match (case-insensitive)
-        for toon in unmatched_team_toons:
-            if toon["username"].lower() == participant_name.lower():
-                matched_toon = toon
-                break
+        # First try an exact match on the normalized name, which also
+        # covers differences in case and punctuation
+        matched_toon = toon_map.get(participant_normalized)
+        if matched_toon and matched_toon["id"] not in remaining_ids:
+            matched_toon = None
 
         # If no exact match, try fuzzy matching
         if not matched_toon:
-            candidate_names = [
-                toon["username"] for toon in unmatched_team_toons
-            ]
-            fuzzy_match = fuzzy_match_username(
-                participant_name, candidate_names, fuzzy_threshold
+            matched_toon = fuzzy_match_normalized(
+                participant_normalized,
+                [
+                    (normalized_name, toon)
+                    for normalized_name, toon in normalized_toons
+                    if toon["id"] in remaining_ids
+                ],
+                fuzzy_threshold,
             )
-            if fuzzy_match:
-                matched_toon = next(
-                    toon
-                    for toon in unmatched_team_toons
-                    if toon["username"] == fuzzy_match
-                )
 
         if matched_toon:
             # Add participant info to matched toon
@@ -441,10 +821,8 @@ def match_participants_to_toons(
             }
             matched_participants.append(matched_participant)
 
-            # Remove from unmatched list
-            unmatched_team_toons = [
-                t for t in unmatched_team_toons if t["id"] != matched_toon["id"]
-            ]
+            # Remove from unmatched set
+            remaining_ids.discard(matched_toon["id"])
         else:
             # This participant is not in our team
             unknown_participant = {
@@ -454,6 +832,10 @@ def match_participants_to_toons(
             }
             unknown_participants.append(unknown_participant)
 
+    unmatched_team_toons = [
+        toon for toon in team_toons if toon["id"] in remaining_ids
+    ]
+
     # Mark remaining team toons as absent
     for toon in unmatched_team_toons:
         absent_toon = {
@@ -497,16 +879,16 @@ def process_warcraftlogs_raid(
                 "error": "Invalid WarcraftLogs URL format",
             }
 
-        # Fetch report metadata
-        report_metadata = fetch_report_metadata(report_code)
+        # Fetch metadata and participants in a single request
+        bundle = warcraftlogs_api.get_report_bundle(report_code)
+        report_metadata = bundle["metadata"] if bundle else None
         if not report_metadata:
             return {
                 "success": False,
                 "error": "Failed to fetch WarcraftLogs report metadata",
             }
 
-        # Fetch participants
-        participants = fetch_report_participants(report_code)
+        participants = bundle["participants"]
         if not participants:
             return {
                 "success": False,
@@ -551,9 +933,25 @@ def process_warcraftlogs_raid(
         }
 
 
-def fetch_report_fights(report_code: str) -> Optional[List[Dict]]:
+def process_warcraftlogs_raids(
+    warcraftlogs_urls: List[str],
+    team_toons: List[Dict],
+    fuzzy_threshold: float = 0.8,
+) -> List[Dict]:
     """
-    Fetch all fights from a WarcraftLogs report.
-    This can be useful for understanding raid progression and attendance.
+    Process several WarcraftLogs reports for raid attendance.
+
+    All reports are fetched up front in one batched GraphQL request, so N
+    reports cost about as much network time as one. Each URL is then
+    processed like process_warcraftlogs_raid, using the cached data.
+
+    Returns:
+        One result dict per URL, in the same order.
     """
-    return warcraftlogs_api.get_report_fights(report_code)
+    report_codes = [extract_report_code(url) for url in warcraftlogs_urls]
+    warcraftlogs_api.get_report_bundles([code for code in report_codes if code])
+
+    return [
+        process_warcraftlogs_raid(url, team_toons, fuzzy_threshold)
+        for url in warcraftlogs_urls
+    ]
@@ -1,13 +1,54 @@
+import hashlib
+import os
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import (
+    Column,
+    MetaData,
+    String,
+    Table,
+    create_engine,
+    inspect,
+    make_url,
+    select,
+    text,
+)
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.schema import CreateIndex, CreateTable
+from app import database
 from app.database import Base
 from app.main import app
+from app.utils.password import hash_password
+from app.utils.session_auth import clear_session_cache
 from fastapi.testclient import TestClient
 from app.config import settings
 
-# Use the test database URI
-TEST_DATABASE_URL = settings.SQLALCHEMY_DATABASE_URI
+# PBKDF2 is deliberately slow, so test users get a low iteration count
+# (verify_password reads the count from the hash, so logins still work)
+# and the fixed test passwords are hashed once per run
+TEST_HASH_ITERATIONS = 1000
+SUPERUSER_PASSWORD_HASH = hash_password(
+    "superpassword123", iterations=TEST_HASH_ITERATIONS
+)
+USER_PASSWORD_HASH = hash_password(
+    "userpassword123", iterations=TEST_HASH_ITERATIONS
+)
+
+
+def hash_test_password(password: str) -> str:
+    """Hash a one-off test password with the low test iteration count."""
+    return hash_password(password, iterations=TEST_HASH_ITERATIONS)
+
+
+# Use the test database URI. Under pytest-xdist (pytest -n auto) each
+# worker gets its own database: workers inserting the same unique rows
+# (e.g. the "superuser" username) in concurrent uncommitted transactions
+# would otherwise block on each other.
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+TEST_DATABASE_URL = make_url(settings.SQLALCHEMY_DATABASE_URI)
+if XDIST_WORKER:
+    TEST_DATABASE_URL = TEST_DATABASE_URL.set(
+        database=f"{settings.DB_NAME}_{XDIST_WORKER}"
+    )
 
 # Create a new engine and session for tests
 engine = create_engine(TEST_DATABASE_URL, echo=False, future=True)
@@ -16,45 +57,143 @@ TestingSessionLocal = sessionmaker(
 )
 
 
+# Records which version of the models the test schema was built from
+schema_version_table = Table(
+    "_schema_version", MetaData(), Column("hash", String, nullable=False)
+)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--forcedb",
+        action="store_true",
+        default=False,
+        help="Drop and recreate the test database schema",
+    )
+
+
+def models_schema_hash() -> str:
+    """Hash the DDL of every model table and index."""
+    digest = hashlib.sha256()
+    for table in Base.metadata.sorted_tables:
+        digest.update(str(CreateTable(table).compile(engine)).encode())
+        for index in sorted(table.indexes, key=lambda index: index.name):
+            digest.update(str(CreateIndex(index).compile(engine)).encode())
+    return digest.hexdigest()
+
+
+def ensure_worker_database():
+    """Create this xdist worker's database if it doesn't exist yet."""
+    admin_engine = create_engine(
+        settings.SQLALCHEMY_DATABASE_URI, isolation_level="AUTOCOMMIT"
+    )
+    try:
+        with admin_engine.connect() as connection:
+            exists = connection.execute(
+                text("SELECT 1 FROM pg_database WHERE datname = :name"),
+                {"name": TEST_DATABASE_URL.database},
+            ).scalar()
+            if not exists:
+                connection.execute(
+                    text(f'CREATE DATABASE "{TEST_DATABASE_URL.database}"')
+                )
+    finally:
+        admin_engine.dispose()
+
+
+def stored_schema_hash():
+    """
+    Return the hash the test schema was last built from, if any.
+
+    _schema_version isn't part of Base.metadata, so a drop_all from another
+    checkout or tool leaves it behind; the hash only counts if every model
+    table is still there.
+    """
+    with engine.connect() as connection:
+        inspector = inspect(connection)
+        if not inspector.has_table("_schema_version"):
+            return None
+        if not all(
+            inspector.has_table(table.name)
+            for table in Base.metadata.sorted_tables
+        ):
+            return None
+        return connection.execute(select(schema_version_table.c.hash)).scalar()
+
+
 @pytest.fixture(scope="session", autouse=True)
-def setup_test_db():
-    # Drop and recreate all tables at the start of the test session
-    Base.metadata.drop_all(bind=engine)
-    Base.metadata.create_all(bind=engine)
+def setup_test_db(request):
+    # Tests never commit (see db_connection), so the schema can be reused
+    # across runs; only rebuild it when the models change
+    if XDIST_WORKER:
+        ensure_worker_database()
+    schema_hash = models_schema_hash()
+    if request.config.getoption("--forcedb") or (
+        stored_schema_hash() != schema_hash
+    ):
+        Base.metadata.drop_all(bind=engine)
+        schema_version_table.drop(bind=engine, checkfirst=True)
+        Base.metadata.create_all(bind=engine)
+        schema_version_table.create(bind=engine)
+        with engine.begin() as connection:
+            connection.execute(
+                schema_version_table.insert().values(hash=schema_hash)
+            )
     yield
-    # Optionally drop tables after tests
-    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(scope="function", autouse=True)
+def db_connection():
+    """
+    Run each test inside an outer transaction that is rolled back at
+    teardown, so nothing a test writes is ever committed.
+
+    Sessions created by the app during the test (via get_db) are bound to
+    the same connection and commit into savepoints, so they see the test's
+    data and the rollback discards theirs too.
+
+    The session auth cache is process-wide and outlives the rollback, so
+    it is cleared on both sides of each test.
+    """
+    clear_session_cache()
+    connection = engine.connect()
+    transaction = connection.begin()
+    session_local_kw = dict(database.SessionLocal.kw)
+    database.SessionLocal.configure(
+        bind=connection, join_transaction_mode="create_savepoint"
+    )
+    try:
+        yield connection
+    finally:
+        database.SessionLocal.kw = session_local_kw
+        transaction.rollback()
+        connection.close()
+        clear_session_cache()
 
 
 @pytest.fixture(scope="function")
-def db_session():
-    session = TestingSessionLocal()
+def db_session(db_connection):
+    session = TestingSessionLocal(
+        bind=db_connection, join_transaction_mode="create_savepoint"
+    )
     try:
         yield session
     finally:
-        session.rollback()
         session.close()
 
 
-@pytest.fixture(scope="function", autouse=True)
-def clean_db():
-    """Clean the database between tests by deleting all data."""
-    yield
-    # Create a fresh session for cleanup
-    cleanup_session = TestingSessionLocal()
-    try:
-        # Delete all data from all tables
-        for table in reversed(Base.metadata.sorted_tables):
-            cleanup_session.execute(table.delete())
-        cleanup_session.commit()
-    except Exception:
-        cleanup_session.rollback()
-    finally:
-        cleanup_session.close()
+@pytest.fixture(scope="session")
+def app_client():
+    """
+    One TestClient for the whole run, so the app lifespan (including its
+    schema check against the database) runs once rather than per test.
+    """
+    with TestClient(app) as c:
+        yield c
 
 
 @pytest.fixture(scope="function")
-def client(db_session):
+def client(app_client, db_session):
     # Dependency override for get_db
     def override_get_db():
         try:
@@ -63,8 +202,11 @@ def client(db_session):
             db_session.close()
 
     app.dependency_overrides = {}
-    from app import database
-
     app.dependency_overrides[database.get_db] = override_get_db
-    with TestClient(app) as c:
-        yield c
+    try:
+        yield app_client
+    finally:
+        # Don't leave later tests pointing at this test's session, or
+        # logged in with its session cookie
+        app.dependency_overrides = {}
+        app_client.cookies.clear()
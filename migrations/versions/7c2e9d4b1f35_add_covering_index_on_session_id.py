@@ -0,0 +1,39 @@
+"""add_covering_index_on_session_id
+
+Revision ID: 7c2e9d4b1f35
+Revises: a141e95f48b1
+Create Date: 2026-10-16 10:12:41.208315
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c2e9d4b1f35'
+down_revision: Union[str, Sequence[str], None] = 'a141e95f48b1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Replace the plain unique index with a covering one so session cookie
+    # lookups can be served by an index-only scan on Postgres. The INCLUDE
+    # clause is ignored on other backends.
+    op.create_index(
+        'ix_sessions_session_id_covering',
+        'sessions',
+        ['session_id'],
+        unique=True,
+        postgresql_include=['id', 'user_id', 'created_at', 'expires_at', 'is_active'],
+    )
+    op.drop_index(op.f('ix_sessions_session_id'), table_name='sessions')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_sessions_session_id'), 'sessions', ['session_id'], unique=True)
+    op.drop_index('ix_sessions_session_id_covering', table_name='sessions')
@@ -3,11 +3,18 @@
 Script to create the first superuser with proper password hashing.
 
 This script creates a superuser account that can be used to manage the application.
-The password is properly hashed using bcrypt before being stored in the database.
+The password is properly hashed using PBKDF2 before being stored in the database.
+
+Usage:
+    python scripts/create_superuser.py
+    python scripts/create_superuser.py --iterations 200000
+    python scripts/create_superuser.py --calibrate
 """
 
+import argparse
 import sys
 import os
+import time
 from pathlib import Path
 
 # Add the project root to the Python path
@@ -18,20 +25,46 @@ from sqlalchemy.orm import Session
 from app.database import get_db, engine
 from app.models.user import User
 from app.models.token import Token
-from app.utils.password import hash_password
+from app.utils.password import ITERATIONS, hash_password
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Iteration counts tried by --calibrate, and the per-hash time budget
+CALIBRATION_ITERATIONS = (100_000, 200_000, 300_000, 400_000, 600_000)
+CALIBRATION_TARGET_SECONDS = 0.25
+
 
-def create_superuser(username: str, password: str, db: Session) -> User:
+def calibrate_iterations() -> int:
+    """
+    Time PBKDF2 hashing at several iteration counts and return the highest
+    count that stays within the target time on this machine.
+    """
+    recommended = CALIBRATION_ITERATIONS[0]
+    for iterations in CALIBRATION_ITERATIONS:
+        start = time.perf_counter()
+        hash_password("x" * 8, iterations=iterations)
+        elapsed = time.perf_counter() - start
+        print(f"{iterations:>8} iterations: {elapsed * 1000:.0f} ms")
+        if elapsed <= CALIBRATION_TARGET_SECONDS:
+            recommended = iterations
+    return recommended
+
+
+def create_superuser(
+    username: str, password: str, db: Session, iterations: int = ITERATIONS
+) -> User:
     """
     Create a superuser with the given credentials.
 
+    The user is flushed, not committed, so the caller can add its token and
+    commit both in one transaction.
+
     Args:
         username: Username for the superuser
         password: Plain text password (will be hashed)
         db: Database session
+        iterations: PBKDF2 iteration count for the password hash
 
     Returns:
         Created User object
@@ -45,7 +78,7 @@ def create_superuser(username: str, password: str, db: Session) -> User:
         raise ValueError(f"User '{username}' already exists")
 
     # Hash the password
-    hashed_password = hash_password(password)
+    hashed_password = hash_password(password, iterations=iterations)
 
     # Create superuser
     user = User(
@@ -56,8 +89,7 @@ def create_superuser(username: str, password: str, db: Session) -> User:
     )
 
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    db.flush()
 
     logger.info(f"Superuser '{username}' created successfully")
     return user
@@ -65,7 +97,7 @@ def create_superuser(username: str, password: str, db: Session) -> User:
 
 def create_superuser_token(user: User, db: Session) -> Token:
     """
-    Create a token for the superuser.
+    Create a token for the superuser. The token is added but not committed.
 
     Args:
         user: The superuser
@@ -79,8 +111,6 @@ def create_superuser_token(user: User, db: Session) -> Token:
     )
 
     db.add(token)
-    db.commit()
-    db.refresh(token)
 
     logger.info(f"Token created for superuser '{user.username}'")
     return token
@@ -88,6 +118,31 @@ def create_superuser_token(user: User, db: Session) -> Token:
 
 def main():
     """Main function to create a superuser interactively."""
+    parser = argparse.ArgumentParser(
+        description="Create the first GuildRoster superuser"
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=ITERATIONS,
+        help=f"PBKDF2 iterations for the password hash (default: {ITERATIONS})",
+    )
+    parser.add_argument(
+        "--calibrate",
+        action="store_true",
+        help="Time password hashing on this machine and suggest --iterations",
+    )
+    args = parser.parse_args()
+
+    if args.calibrate:
+        recommended = calibrate_iterations()
+        print()
+        print(
+            f"Recommended: --iterations {recommended} "
+            f"(<= {CALIBRATION_TARGET_SECONDS * 1000:.0f} ms per hash)"
+        )
+        return
+
     print("=== GuildRoster Superuser Creation ===")
     print()
 
@@ -114,15 +169,21 @@ def main():
         print("Error: Password must be at least 8 characters long")
         sys.exit(1)
 
+    # Bound before the try so the handlers below can tell whether the
+    # session was ever opened
+    db = None
     try:
         # Get database session
         db = next(get_db())
 
         # Create superuser
-        user = create_superuser(username, password, db)
+        user = create_superuser(
+            username, password, db, iterations=args.iterations
+        )
 
-        # Create token
+        # Create token and commit user + token together
         token = create_superuser_token(user, db)
+        db.commit()
 
         print()
         print("=== Superuser Created Successfully ===")
@@ -139,14 +200,19 @@ def main():
         print("- Users: http://localhost:8000/users/")
 
     except ValueError as e:
+        if db is not None:
+            db.rollback()
         print(f"Error: {e}")
         sys.exit(1)
     except Exception as e:
+        if db is not None:
+            db.rollback()
         logger.error(f"Unexpected error: {e}")
         print(f"Error: {e}")
         sys.exit(1)
     finally:
-        db.close()
+        if db is not None:
+            db.close()
 
 
 if __name__ == "__main__":
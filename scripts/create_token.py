@@ -6,59 +6,133 @@ Usage:
     python scripts/create_token.py --type system --name "Development Token"
     python scripts/create_token.py --type api --name "Frontend App"
     python scripts/create_token.py --type user --user-id 1 --name "User Token"
+    python scripts/create_token.py --batch tokens.json
 """
 
 import argparse
+import json
 import sys
 import os
-from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Dict, List
 
 # Add the project root to Python path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from sqlalchemy.orm import Session
-from app.database import get_db
-from app.models.token import Token
-from app.models.user import User
+# The app modules build the database engine on import, so they are only
+# loaded once the arguments are valid; --help and usage errors stay fast.
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+    from app.models.token import Token
 
 
-def create_token(
+def _build_token(
     token_type: str,
     name: str,
     user_id: int = None,
     expires_in_days: int = None,
-    db: Session = None,
-) -> Token:
-    """Create a token and return it."""
+) -> "Token":
+    """Build an unsaved token of the given type."""
+    from app.models.token import Token
+
     if token_type == "user":
         if not user_id:
             raise ValueError("user_id is required for user tokens")
-        token = Token.create_user_token(
+        return Token.create_user_token(
             user_id=user_id, name=name, expires_in_days=expires_in_days
         )
     elif token_type == "system":
-        token = Token.create_system_token(
+        return Token.create_system_token(
             name=name, expires_in_days=expires_in_days
         )
     elif token_type == "api":
-        token = Token.create_api_token(
+        return Token.create_api_token(
             name=name, expires_in_days=expires_in_days
         )
     else:
         raise ValueError("token_type must be 'user', 'system', or 'api'")
 
-    db.add(token)
+
+def bulk_create_tokens(
+    specs: List[Dict[str, Any]], db: "Session"
+) -> List["Token"]:
+    """
+    Create several tokens in one transaction and return them.
+
+    Each spec holds the keyword arguments of create_token (token_type, name,
+    user_id, expires_in_days). All tokens are validated before anything is
+    added, then inserted with a single flush and commit.
+    """
+    tokens = [_build_token(**spec) for spec in specs]
+
+    db.add_all(tokens)
     db.commit()
-    db.refresh(token)
 
-    return token
+    return tokens
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Create API tokens for GuildRoster",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+def create_token(
+    token_type: str,
+    name: str,
+    user_id: int = None,
+    expires_in_days: int = None,
+    db: "Session" = None,
+) -> "Token":
+    """Create a token and return it."""
+    spec = {
+        "token_type": token_type,
+        "name": name,
+        "user_id": user_id,
+        "expires_in_days": expires_in_days,
+    }
+    return bulk_create_tokens([spec], db)[0]
+
+
+# Tokens written to stdout per write() call in batch mode
+_BATCH_OUTPUT_CHUNK = 100
+
+
+def create_batch(path: str) -> None:
+    """Create every token listed in a JSON spec file and print their keys."""
+    try:
+        with open(path) as f:
+            specs = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Error reading {path}: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if not isinstance(specs, list):
+        print(f"Error: {path} must contain a JSON list", file=sys.stderr)
+        sys.exit(1)
+
+    from app.database import get_db
+
+    try:
+        db = next(get_db())
+        # Keep the flushed values after commit so printing N tokens doesn't
+        # reload each one with its own SELECT
+        db.expire_on_commit = False
+        tokens = bulk_create_tokens(specs, db)
+
+        print(f"✅ Created {len(tokens)} tokens", flush=True)
+        for start in range(0, len(tokens), _BATCH_OUTPUT_CHUNK):
+            chunk = tokens[start : start + _BATCH_OUTPUT_CHUNK]
+            sys.stdout.write(
+                "".join(
+                    f"{t.id}\t{t.token_type}\t{t.name}\t{t.key}\n"
+                    for t in chunk
+                )
+            )
+            sys.stdout.flush()
+
+    except Exception as e:
+        print(f"Error creating tokens: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        if "db" in locals():
+            db.close()
+
+
+_EPILOG = """
 Examples:
   # Create a system token for development
   python scripts/create_token.py --type system --name "Development Token"
@@ -71,19 +145,27 @@ Examples:
   
   # Create a token with expiration
   python scripts/create_token.py --type system --name "Temporary Token" --expires 30
-        """,
+
+  # Create several tokens in one transaction from a JSON list of specs
+  # ([{"token_type": "api", "name": "Frontend App"}, ...])
+  python scripts/create_token.py --batch tokens.json
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Create API tokens for GuildRoster",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG,
     )
 
     parser.add_argument(
         "--type",
-        required=True,
         choices=["user", "system", "api"],
         help="Type of token to create",
     )
 
-    parser.add_argument(
-        "--name", required=True, help="Name/description for the token"
-    )
+    parser.add_argument("--name", help="Name/description for the token")
 
     parser.add_argument(
         "--user-id", type=int, help="User ID (required for user tokens)"
@@ -93,20 +175,35 @@ Examples:
         "--expires", type=int, help="Expiration in days (optional)"
     )
 
+    parser.add_argument(
+        "--batch",
+        help="JSON file listing token specs to create in one transaction",
+    )
+
     args = parser.parse_args()
 
+    if args.batch:
+        create_batch(args.batch)
+        return
+
+    if not args.type or not args.name:
+        parser.error("--type and --name are required unless --batch is given")
+
     # Validate user_id for user tokens
     if args.type == "user" and not args.user_id:
         print("Error: --user-id is required for user tokens", file=sys.stderr)
         sys.exit(1)
 
+    from app.database import get_db
+    from app.models.user import User
+
     try:
         # Get database session
         db = next(get_db())
 
         # Validate user exists for user tokens
         if args.type == "user" and args.user_id:
-            user = db.query(User).filter(User.id == args.user_id).first()
+            user = db.get(User, args.user_id)
             if not user:
                 print(
                     f"Error: User with ID {args.user_id} not found",
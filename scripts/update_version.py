@@ -7,13 +7,24 @@ This script updates the version across all relevant files in the project.
 
 import re
 import sys
-import subprocess
+from functools import lru_cache
 from pathlib import Path
-from typing import Tuple
+from typing import Dict, Tuple
 
+_VERSION_RE = re.compile(r'VERSION:\s*str\s*=\s*"([^"]+)"')
+_BACKEND_VERSION_RE = re.compile(r'(VERSION:\s*str\s*=\s*)"[^"]+"')
+_FRONTEND_VERSION_RE = re.compile(r'("version":\s*)"[^"]+"')
 
+# (file, pattern, field name) for every file that carries the version
+_VERSION_FILES = (
+    (Path("app/config.py"), _BACKEND_VERSION_RE, "VERSION"),
+    (Path("frontend/package.json"), _FRONTEND_VERSION_RE, "version"),
+)
+
+
+@lru_cache(maxsize=1)
 def get_current_version() -> str:
-    """Get current version from app/config.py."""
+    """Get current version from app/config.py (read once per run)."""
     config_file = Path("app/config.py")
     if not config_file.exists():
         raise FileNotFoundError("app/config.py not found")
@@ -21,7 +32,7 @@ def get_current_version() -> str:
     with open(config_file, "r") as f:
         content = f.read()
 
-    match = re.search(r'VERSION:\s*str\s*=\s*"([^"]+)"', content)
+    match = _VERSION_RE.search(content)
     if not match:
         raise ValueError("VERSION not found in app/config.py")
 
@@ -42,38 +53,39 @@ def format_version(major: int, minor: int, patch: int) -> str:
     return f"{major}.{minor}.{patch}"
 
 
-def update_backend_version(version: str) -> None:
-    """Update version in app/config.py."""
-    config_file = Path("app/config.py")
+def stage_updates(version: str) -> Dict[Path, str]:
+    """
+    Compute the new content of every version file without writing anything.
 
-    with open(config_file, "r") as f:
-        content = f.read()
+    Returns a mapping of path to new content, leaving out files that
+    already carry the requested version.
+    """
+    staged = {}
+    for path, pattern, field in _VERSION_FILES:
+        original = path.read_text()
+        content, count = pattern.subn(rf'\1"{version}"', original)
+        if not count:
+            raise ValueError(f"{field} not found in {path}")
 
-    # Update VERSION line
-    content = re.sub(
-        r'(VERSION:\s*str\s*=\s*)"[^"]+"', rf'\1"{version}"', content
-    )
+        # Leave the file (and its mtime) alone if nothing changed
+        if content == original:
+            print(f"✓ {path} already at {version}, unchanged")
+            continue
 
-    with open(config_file, "w") as f:
-        f.write(content)
+        staged[path] = content
 
-    print(f"✓ Updated backend version to {version}")
-
-
-def update_frontend_version(version: str) -> None:
-    """Update version in frontend/package.json."""
-    package_file = Path("frontend/package.json")
-
-    with open(package_file, "r") as f:
-        content = f.read()
+    return staged
 
-    # Update version field
-    content = re.sub(r'("version":\s*)"[^"]+"', rf'\1"{version}"', content)
 
-    with open(package_file, "w") as f:
-        f.write(content)
+def write_updates(staged: Dict[Path, str], version: str) -> None:
+    """Write staged version files, each replaced atomically."""
+    for path, content in staged.items():
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_text(content)
+        tmp_path.replace(path)
+        print(f"✓ Updated {path} to {version}")
 
-    print(f"✓ Updated frontend version to {version}")
+    get_current_version.cache_clear()
 
 
 def bump_version(current_version: str, bump_type: str) -> str:
@@ -138,9 +150,9 @@ def main():
 
         print(f"Updating version to {new_version}...")
 
-        # Update versions in files
-        update_backend_version(new_version)
-        update_frontend_version(new_version)
+        # Stage both files before writing either, so a missing field in
+        # one of them leaves the tree untouched
+        write_updates(stage_updates(new_version), new_version)
 
         print(f"\n✓ Version updated to {new_version}")
         print("\nNext steps:")
@@ -1,9 +1,9 @@
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 
-from app.main import app
 from app.models.attendance import Attendance, AttendanceStatus
 from app.models.raid import Raid
 from app.models.toon import Toon
@@ -15,13 +15,24 @@ from app.database import get_db
 
 
 @pytest.fixture
-def client():
-    return TestClient(app)
+def client(app_client: TestClient):
+    """
+    The run's shared TestClient, without the conftest get_db override:
+    requests use the app's own sessions, which are bound to the test
+    connection, so the db_session below stays open across requests.
+    """
+    yield app_client
+    app_client.cookies.clear()
 
 
 @pytest.fixture
 def db_session():
-    """Get database session for testing."""
+    """
+    Get database session for testing.
+
+    The fixtures below only flush: the app's request sessions share this
+    session's connection, so they see flushed rows without a commit.
+    """
     for session in get_db():
         yield session
         break
@@ -37,8 +48,7 @@ def test_user(db_session: Session):
         is_superuser=False
     )
     db_session.add(user)
-    db_session.commit()
-    db_session.refresh(user)
+    db_session.flush()
     return user
 
 
@@ -52,8 +62,7 @@ def test_token(db_session: Session, test_user: User):
         name="Test Token"
     )
     db_session.add(token)
-    db_session.commit()
-    db_session.refresh(token)
+    db_session.flush()
     return token
 
 
@@ -65,8 +74,7 @@ def test_guild(db_session: Session, test_user: User):
         created_by=test_user.id
     )
     db_session.add(guild)
-    db_session.commit()
-    db_session.refresh(guild)
+    db_session.flush()
     return guild
 
 
@@ -79,8 +87,7 @@ def test_team(db_session: Session, test_guild: Guild, test_user: User):
         created_by=test_user.id
     )
     db_session.add(team)
-    db_session.commit()
-    db_session.refresh(team)
+    db_session.flush()
     return team
 
 
@@ -93,29 +100,25 @@ def test_toon(db_session: Session):
         role="Tank"
     )
     db_session.add(toon)
-    db_session.commit()
-    db_session.refresh(toon)
+    db_session.flush()
     return toon
 
 
 @pytest.fixture
 def test_raids(db_session: Session, test_team: Team):
     """Create test raids."""
-    raids = []
-    for i in range(3):
-        raid = Raid(
+    raids = [
+        Raid(
             scheduled_at=datetime.now() - timedelta(days=i),
             team_id=test_team.id,
             scenario_name=f"Test Scenario {i+1}",
             scenario_difficulty="Mythic",
             scenario_size="20"
         )
-        db_session.add(raid)
-        raids.append(raid)
-    
-    db_session.commit()
-    for raid in raids:
-        db_session.refresh(raid)
+        for i in range(3)
+    ]
+    db_session.add_all(raids)
+    db_session.flush()
     return raids
 
 
@@ -129,16 +132,15 @@ def test_get_team_attendance_view_success(
 ):
     """Test successful team attendance view retrieval."""
     # Create attendance records
-    for i, raid in enumerate(test_raids):
-        status = AttendanceStatus.PRESENT if i < 2 else AttendanceStatus.ABSENT
-        attendance = Attendance(
+    db_session.add_all([
+        Attendance(
             raid_id=raid.id,
             toon_id=test_toon.id,
-            status=status,
+            status=AttendanceStatus.PRESENT if i < 2 else AttendanceStatus.ABSENT,
             notes=f"Test note {i}" if i == 0 else None
         )
-        db_session.add(attendance)
-    
+        for i, raid in enumerate(test_raids)
+    ])
     db_session.commit()
 
     # Make request
@@ -209,9 +211,7 @@ def test_get_team_attendance_view_with_benched(
             status=AttendanceStatus.ABSENT
         )
     ]
-    
-    for attendance in attendance_records:
-        db_session.add(attendance)
+    db_session.add_all(attendance_records)
     db_session.commit()
 
     # Make request
@@ -323,4 +323,263 @@ def test_get_team_attendance_view_wrong_guild(
     )
 
     assert response.status_code == 400
-    assert "Team does not belong to the specified guild" in response.json()["detail"] 
\ No newline at end of file
+    assert "Team does not belong to the specified guild" in response.json()["detail"] 
+
+@pytest.fixture
+def test_superuser_token(db_session: Session):
+    """Create a superuser token."""
+    user = User(
+        username="testsuperuser",
+        hashed_password="hashed_password",
+        is_active=True,
+        is_superuser=True
+    )
+    db_session.add(user)
+    db_session.flush()
+    token = Token(
+        key="test_superuser_token_key",
+        user_id=user.id,
+        token_type="user",
+        name="Superuser Token"
+    )
+    db_session.add(token)
+    db_session.flush()
+    return token
+
+
+@pytest.mark.parametrize("count", [2, 50, 100])
+def test_create_attendance_bulk(
+    client: TestClient,
+    db_session: Session,
+    test_superuser_token: Token,
+    test_raids: list[Raid],
+    count: int
+):
+    """Test bulk creation at increasing batch sizes (100 is the limit)."""
+    toons = [
+        Toon(username=f"BulkToon{i}", class_="Warrior", role="Tank")
+        for i in range(count)
+    ]
+    db_session.add_all(toons)
+    db_session.flush()
+    toon_ids = [toon.id for toon in toons]
+    raid_id = test_raids[0].id
+    db_session.commit()
+
+    response = client.post(
+        "/attendance/bulk",
+        json={
+            "attendance_records": [
+                {"raid_id": raid_id, "toon_id": toon_id, "status": "present"}
+                for toon_id in toon_ids
+            ]
+        },
+        headers={"Authorization": f"Bearer {test_superuser_token.key}"}
+    )
+
+    assert response.status_code == 201
+    data = response.json()
+    assert [record["toon_id"] for record in data] == toon_ids
+    assert all(record["status"] == "present" for record in data)
+    assert (
+        db_session.query(Attendance)
+        .filter(Attendance.raid_id == raid_id)
+        .count()
+        == count
+    )
+
+
+def test_create_attendance_bulk_existing_record(
+    client: TestClient,
+    db_session: Session,
+    test_superuser_token: Token,
+    test_toon: Toon,
+    test_raids: list[Raid]
+):
+    """Test that bulk creation rejects a record that already exists."""
+    raid_id = test_raids[0].id
+    toon_id = test_toon.id
+    db_session.add(
+        Attendance(
+            raid_id=raid_id, toon_id=toon_id, status=AttendanceStatus.PRESENT
+        )
+    )
+    db_session.commit()
+
+    response = client.post(
+        "/attendance/bulk",
+        json={
+            "attendance_records": [
+                {"raid_id": raid_id, "toon_id": toon_id, "status": "absent"}
+            ]
+        },
+        headers={"Authorization": f"Bearer {test_superuser_token.key}"}
+    )
+
+    assert response.status_code == 400
+    assert "already exists" in response.json()["detail"]
+
+
+def test_create_attendance_bulk_missing_toon(
+    client: TestClient,
+    test_superuser_token: Token,
+    test_raids: list[Raid]
+):
+    """Test that bulk creation 404s on an unknown toon."""
+    response = client.post(
+        "/attendance/bulk",
+        json={
+            "attendance_records": [
+                {"raid_id": test_raids[0].id, "toon_id": 99999, "status": "present"}
+            ]
+        },
+        headers={"Authorization": f"Bearer {test_superuser_token.key}"}
+    )
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Toon not found"
+
+
+def test_update_attendance_bulk(
+    client: TestClient,
+    db_session: Session,
+    test_superuser_token: Token,
+    test_toon: Toon,
+    test_raids: list[Raid]
+):
+    """Test bulk update of several records in one request."""
+    records = [
+        Attendance(
+            raid_id=raid.id, toon_id=test_toon.id, status=AttendanceStatus.PRESENT
+        )
+        for raid in test_raids
+    ]
+    db_session.add_all(records)
+    db_session.flush()
+    record_ids = [record.id for record in records]
+    db_session.commit()
+
+    response = client.put(
+        "/attendance/bulk",
+        json={
+            "attendance_records": [
+                {"id": record_id, "status": "absent"} for record_id in record_ids
+            ]
+        },
+        headers={"Authorization": f"Bearer {test_superuser_token.key}"}
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [record["id"] for record in data] == record_ids
+    assert all(record["status"] == "absent" for record in data)
+
+    response = client.put(
+        "/attendance/bulk",
+        json={"attendance_records": [{"id": 99999, "status": "absent"}]},
+        headers={"Authorization": f"Bearer {test_superuser_token.key}"}
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.parametrize(
+    "filter_key, expected_count",
+    [("raid_id", 2), ("toon_id", 2), ("team_id", 3), ("status", 1)],
+)
+def test_list_attendance_filter(
+    client: TestClient,
+    db_session: Session,
+    test_token: Token,
+    test_team: Team,
+    test_toon: Toon,
+    test_raids: list[Raid],
+    filter_key: str,
+    expected_count: int
+):
+    """Test each list filter against the same set of records."""
+    other_toon = Toon(username="OtherToon", class_="Mage", role="Ranged DPS")
+    db_session.add(other_toon)
+    db_session.flush()
+    db_session.add_all([
+        Attendance(
+            raid_id=test_raids[0].id,
+            toon_id=test_toon.id,
+            status=AttendanceStatus.PRESENT
+        ),
+        Attendance(
+            raid_id=test_raids[1].id,
+            toon_id=test_toon.id,
+            status=AttendanceStatus.PRESENT
+        ),
+        Attendance(
+            raid_id=test_raids[0].id,
+            toon_id=other_toon.id,
+            status=AttendanceStatus.ABSENT
+        ),
+    ])
+    filter_values = {
+        "raid_id": test_raids[0].id,
+        "toon_id": test_toon.id,
+        "team_id": test_team.id,
+        "status": "absent",
+    }
+    db_session.commit()
+
+    response = client.get(
+        "/attendance/",
+        params={filter_key: filter_values[filter_key]},
+        headers={"Authorization": f"Bearer {test_token.key}"}
+    )
+
+    assert response.status_code == 200
+    assert len(response.json()) == expected_count
+
+
+def test_create_attendance_bulk_statement_count_constant(
+    client: TestClient,
+    db_session: Session,
+    db_connection,
+    test_superuser_token: Token,
+    test_raids: list[Raid]
+):
+    """Test that a bulk create issues the same SQL for 10 and 100 records."""
+    toons = [
+        Toon(username=f"ScaleToon{i}", class_="Warrior", role="Tank")
+        for i in range(110)
+    ]
+    db_session.add_all(toons)
+    db_session.flush()
+    toon_ids = [toon.id for toon in toons]
+    raid_ids = [raid.id for raid in test_raids]
+    db_session.commit()
+
+    def statement_count(raid_id, batch_toon_ids):
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(db_connection, "before_cursor_execute", record)
+        try:
+            response = client.post(
+                "/attendance/bulk",
+                json={
+                    "attendance_records": [
+                        {"raid_id": raid_id, "toon_id": toon_id, "status": "present"}
+                        for toon_id in batch_toon_ids
+                    ]
+                },
+                headers={"Authorization": f"Bearer {test_superuser_token.key}"}
+            )
+        finally:
+            event.remove(db_connection, "before_cursor_execute", record)
+        # Only a batch that was actually created is worth counting
+        assert response.status_code == 201, response.text
+        assert len(response.json()) == len(batch_toon_ids)
+        return len(statements)
+
+    small_batch = statement_count(raid_ids[0], toon_ids[:10])
+    large_batch = statement_count(raid_ids[1], toon_ids[10:])
+
+    assert db_session.query(Attendance).count() == 110
+    assert small_batch == large_batch
@@ -4,19 +4,19 @@ from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 from app.models.user import User
 from app.models.token import Token
-from app.utils.password import hash_password
+from conftest import SUPERUSER_PASSWORD_HASH, USER_PASSWORD_HASH
 
 
 class TestGuildAPI:
     def _create_superuser(self, db_session: Session):
         user = User(
             username="superuser",
-            hashed_password=hash_password("superpassword123"),
+            hashed_password=SUPERUSER_PASSWORD_HASH,
             is_active=True,
             is_superuser=True,
         )
         db_session.add(user)
-        db_session.commit()
+        db_session.flush()  # Assigns user.id for the token
         token = Token.create_user_token(user.id, "Superuser Token")
         db_session.add(token)
         db_session.commit()
@@ -25,12 +25,12 @@ class TestGuildAPI:
     def _create_regular_user(self, db_session: Session):
         user = User(
             username="regularuser",
-            hashed_password=hash_password("userpassword123"),
+            hashed_password=USER_PASSWORD_HASH,
             is_active=True,
             is_superuser=False,
         )
         db_session.add(user)
-        db_session.commit()
+        db_session.flush()  # Assigns user.id for the token
         token = Token.create_user_token(user.id, "User Token")
         db_session.add(token)
         db_session.commit()
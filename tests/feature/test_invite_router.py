@@ -11,7 +11,7 @@ from datetime import datetime, timedelta
 from app.models.user import User
 from app.models.token import Token
 from app.models.invite import Invite
-from app.utils.password import hash_password
+from conftest import hash_test_password
 
 
 class TestInviteRouter:
@@ -24,7 +24,7 @@ class TestInviteRouter:
         """Create a test user and return the user object."""
         user = User(
             username=username,
-            hashed_password=hash_password("testpassword123"),
+            hashed_password=hash_test_password("testpassword123"),
             is_superuser=is_superuser,
         )
         db_session.add(user)
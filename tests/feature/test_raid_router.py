@@ -10,7 +10,7 @@ from app.models.team import Team
 from app.models.scenario import Scenario
 from app.models.raid import Raid
 from app.models.token import Token
-from app.utils.password import hash_password
+from conftest import SUPERUSER_PASSWORD_HASH, USER_PASSWORD_HASH
 
 
 class TestRaidAPI:
@@ -18,12 +18,12 @@ class TestRaidAPI:
         """Helper method to create a superuser with token."""
         user = User(
             username="superuser",
-            hashed_password=hash_password("superpassword123"),
+            hashed_password=SUPERUSER_PASSWORD_HASH,
             is_active=True,
             is_superuser=True,
         )
         db_session.add(user)
-        db_session.commit()
+        db_session.flush()  # Assigns user.id for the token
         user_id = user.id  # Store ID before making API request
         token = Token.create_user_token(user_id, "Superuser Token")  # type: ignore[arg-type]
         db_session.add(token)
@@ -34,12 +34,12 @@ class TestRaidAPI:
         """Helper method to create a regular user with token."""
         user = User(
             username="regularuser",
-            hashed_password=hash_password("userpassword123"),
+            hashed_password=USER_PASSWORD_HASH,
             is_active=True,
             is_superuser=False,
         )
         db_session.add(user)
-        db_session.commit()
+        db_session.flush()  # Assigns user.id for the token
         user_id = user.id  # Store ID before making API request
         token = Token.create_user_token(user_id, "User Token")  # type: ignore[arg-type]
         db_session.add(token)
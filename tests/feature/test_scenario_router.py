@@ -6,7 +6,7 @@ from sqlalchemy.orm import Session
 from app.models.user import User
 from app.models.scenario import Scenario, SCENARIO_DIFFICULTIES, SCENARIO_SIZES
 from app.models.token import Token
-from app.utils.password import hash_password
+from conftest import SUPERUSER_PASSWORD_HASH, USER_PASSWORD_HASH
 
 
 class TestScenarioAPI:
@@ -14,12 +14,12 @@ class TestScenarioAPI:
         """Helper method to create a superuser with token."""
         user = User(
             username="superuser",
-            hashed_password=hash_password("superpassword123"),
+            hashed_password=SUPERUSER_PASSWORD_HASH,
             is_active=True,
             is_superuser=True,
         )
         db_session.add(user)
-        db_session.commit()
+        db_session.flush()  # Assigns user.id for the token
         user_id = user.id  # Store ID before making API request
         token = Token.create_user_token(user_id, "Superuser Token")  # type: ignore[arg-type]
         db_session.add(token)
@@ -30,12 +30,12 @@ class TestScenarioAPI:
         """Helper method to create a regular user with token."""
         user = User(
             username="regularuser",
-            hashed_password=hash_password("userpassword123"),
+            hashed_password=USER_PASSWORD_HASH,
             is_active=True,
             is_superuser=False,
         )
         db_session.add(user)
-        db_session.commit()
+        db_session.flush()  # Assigns user.id for the token
         user_id = user.id  # Store ID before making API request
         token = Token.create_user_token(user_id, "User Token")  # type: ignore[arg-type]
         db_session.add(token)
@@ -5,7 +5,7 @@ from sqlalchemy.orm import Session
 from app.main import app
 from app.models.user import User
 from app.models.session import Session as SessionModel
-from app.utils.password import hash_password
+from conftest import hash_test_password
 
 client = TestClient(app)
 
@@ -15,7 +15,7 @@ class TestSessionIntegration:
         """Create a test user for integration testing."""
         user = User(
             username="testuser",
-            hashed_password=hash_password("testpassword"),
+            hashed_password=hash_test_password("testpassword"),
             is_active=True,
             is_superuser=False,
         )
@@ -6,7 +6,7 @@ from app.models.user import User
 from app.models.guild import Guild
 from app.models.team import Team
 from app.models.token import Token
-from app.utils.password import hash_password
+from conftest import SUPERUSER_PASSWORD_HASH, USER_PASSWORD_HASH
 
 
 class TestTeamAPI:
@@ -14,12 +14,12 @@ class TestTeamAPI:
         """Helper method to create a superuser with token."""
         user = User(
             username="superuser",
-            hashed_password=hash_password("superpassword123"),
+            hashed_password=SUPERUSER_PASSWORD_HASH,
             is_active=True,
             is_superuser=True,
         )
         db_session.add(user)
-        db_session.commit()
+        db_session.flush()  # Assigns user.id for the token
         token = Token.create_user_token(user.id, "Superuser Token")  # type: ignore[arg-type]
         db_session.add(token)
         db_session.commit()
@@ -29,12 +29,12 @@ class TestTeamAPI:
         """Helper method to create a regular user with token."""
         user = User(
             username="regularuser",
-            hashed_password=hash_password("userpassword123"),
+            hashed_password=USER_PASSWORD_HASH,
             is_active=True,
             is_superuser=False,
         )
         db_session.add(user)
-        db_session.commit()
+        db_session.flush()  # Assigns user.id for the token
         token = Token.create_user_token(user.id, "User Token")  # type: ignore[arg-type]
         db_session.add(token)
         db_session.commit()
@@ -9,14 +9,19 @@ from sqlalchemy.orm import Session
 
 from app.models.user import User
 from app.models.token import Token
-from app.utils.password import hash_password, verify_password
+from app.utils.password import verify_password
+from conftest import (
+    SUPERUSER_PASSWORD_HASH,
+    USER_PASSWORD_HASH,
+    hash_test_password,
+)
 
 
 class TestUserAuthentication:
     def _create_test_superuser(self, db_session: Session) -> tuple[User, str]:
         """Create a test superuser and return user and session_id."""
         # Create superuser
-        hashed_password = hash_password("superpassword123")
+        hashed_password = SUPERUSER_PASSWORD_HASH
         user = User(
             username="superuser",
             hashed_password=hashed_password,
@@ -97,7 +102,7 @@ class TestUserAuthentication:
     ):
         """Test user creation by regular user (not superuser)."""
         # Create regular user
-        hashed_password = hash_password("userpassword123")
+        hashed_password = USER_PASSWORD_HASH
         user = User(
             username="regularuser",
             hashed_password=hashed_password,
@@ -129,7 +134,7 @@ class TestUserAuthentication:
     def test_login_success(self, client: TestClient, db_session: Session):
         """Test successful user login."""
         # Create user
-        hashed_password = hash_password("userpassword123")
+        hashed_password = USER_PASSWORD_HASH
         user = User(
             username="testuser",
             hashed_password=hashed_password,
@@ -158,7 +163,7 @@ class TestUserAuthentication:
     ):
         """Test login with wrong password."""
         # Create user
-        hashed_password = hash_password("userpassword123")
+        hashed_password = USER_PASSWORD_HASH
         user = User(
             username="testuser",
             hashed_password=hashed_password,
@@ -187,7 +192,7 @@ class TestUserAuthentication:
     def test_login_inactive_user(self, client: TestClient, db_session: Session):
         """Test login with inactive user."""
         # Create inactive user
-        hashed_password = hash_password("userpassword123")
+        hashed_password = USER_PASSWORD_HASH
         user = User(
             username="inactiveuser",
             hashed_password=hashed_password,
@@ -209,7 +214,7 @@ class TestUserAuthentication:
         cookies = {"session_id": session_id}
 
         # Create user to update
-        hashed_password = hash_password("oldpassword123")
+        hashed_password = hash_test_password("oldpassword123")
         user = User(
             username="updateuser",
             hashed_password=hashed_password,
@@ -240,7 +245,7 @@ class TestUserAuthentication:
         cookies = {"session_id": session_id}
 
         # Create user to delete
-        hashed_password = hash_password("userpassword123")
+        hashed_password = USER_PASSWORD_HASH
         user = User(
             username="deleteuser",
             hashed_password=hashed_password,
@@ -7,7 +7,7 @@ import pytest
 from sqlalchemy.orm import Session
 from app.models.guild import Guild
 from app.models.user import User
-from app.utils.password import hash_password
+from conftest import USER_PASSWORD_HASH
 
 
 class TestGuildModel:
@@ -16,7 +16,7 @@ class TestGuildModel:
         # Create a user first
         user = User(
             username="testuser",
-            hashed_password=hash_password("password123"),
+            hashed_password=USER_PASSWORD_HASH,
             is_active=True,
             is_superuser=True,
         )
@@ -42,7 +42,7 @@ class TestGuildModel:
         # Create a user
         user = User(
             username="guildleader",
-            hashed_password=hash_password("password123"),
+            hashed_password=USER_PASSWORD_HASH,
             is_active=True,
             is_superuser=True,
         )
@@ -66,7 +66,7 @@ class TestGuildModel:
         # Create a user
         user = User(
             username="testuser",
-            hashed_password=hash_password("password123"),
+            hashed_password=USER_PASSWORD_HASH,
             is_active=True,
             is_superuser=True,
         )
@@ -9,7 +9,7 @@ from sqlalchemy.exc import IntegrityError
 from app.models.team import Team
 from app.models.guild import Guild
 from app.models.user import User
-from app.utils.password import hash_password
+from conftest import USER_PASSWORD_HASH
 
 
 class TestTeamModel:
@@ -18,7 +18,7 @@ class TestTeamModel:
         # Create a user first
         user = User(
             username="testuser",
-            hashed_password=hash_password("password123"),
+            hashed_password=USER_PASSWORD_HASH,
             is_active=True,
             is_superuser=True,
         )
@@ -57,7 +57,7 @@ class TestTeamModel:
         # Create a user
         user = User(
             username="teamleader",
-            hashed_password=hash_password("password123"),
+            hashed_password=USER_PASSWORD_HASH,
             is_active=True,
             is_superuser=True,
         )
@@ -93,7 +93,7 @@ class TestTeamModel:
         # Create a user
         user = User(
             username="testuser",
-            hashed_password=hash_password("password123"),
+            hashed_password=USER_PASSWORD_HASH,
             is_active=True,
             is_superuser=True,
         )
@@ -134,7 +134,7 @@ class TestTeamModel:
         # Create a user
         user = User(
             username="testuser",
-            hashed_password=hash_password("password123"),
+            hashed_password=USER_PASSWORD_HASH,
             is_active=True,
             is_superuser=True,
         )
@@ -178,7 +178,7 @@ class TestTeamModel:
         # Create user and guild
         user = User(
             username="testuser",
-            hashed_password=hash_password("password123"),
+            hashed_password=USER_PASSWORD_HASH,
             is_active=True,
             is_superuser=True,
         )
@@ -226,7 +226,7 @@ class TestTeamModel:
         # Create user and guild
         user = User(
             username="testuser",
-            hashed_password=hash_password("password123"),
+            hashed_password=USER_PASSWORD_HASH,
             is_active=True,
             is_superuser=True,
         )
@@ -269,7 +269,7 @@ class TestTeamModel:
         # Create user and guild
         user = User(
             username="testuser",
-            hashed_password=hash_password("password123"),
+            hashed_password=USER_PASSWORD_HASH,
             is_active=True,
             is_superuser=True,
         )
@@ -310,7 +310,7 @@ class TestTeamModel:
         # Create user and guild
         user = User(
             username="testuser",
-            hashed_password=hash_password("password123"),
+            hashed_password=USER_PASSWORD_HASH,
             is_active=True,
             is_superuser=True,
         )
@@ -191,3 +191,41 @@ class TestAttendanceImageGenerator:
         # Verify image was modified
         img_bytes = img.tobytes()
         assert len(img_bytes) > 0
+
+    def test_get_current_period_is_memoized(self):
+        """Repeated calls within the same minute reuse the cached period."""
+        assert get_current_period() == get_current_period()
+
+    def test_attendance_color_thresholds(self):
+        """Test attendance percentage color bucketing."""
+        generator = AttendanceImageGenerator()
+
+        assert generator._att_color(85.0) == generator.COLORS["success"]
+        assert generator._att_color(80.0) == generator.COLORS["success"]
+        assert generator._att_color(70.0) == generator.COLORS["warning"]
+        assert generator._att_color(60.0) == generator.COLORS["warning"]
+        assert generator._att_color(59.9) == generator.COLORS["error"]
+
+    def test_render_cell_sprite(self):
+        """Test pre-rendering a status cell."""
+        generator = AttendanceImageGenerator()
+        font = generator._get_font(generator.font_size_large, bold=True)
+
+        sprite = generator._render_cell_sprite(30, "present", font)
+
+        assert sprite.mode == "RGBA"
+        assert sprite.size == (31, 31)
+        # Cell center is filled with the status background color
+        assert sprite.getpixel((2, 15))[:3] == generator.COLORS["success"]
+
+    def test_canvas_reused_between_reports(self):
+        """Test that consecutive reports reuse the same canvas."""
+        generator = AttendanceImageGenerator()
+
+        first = generator._get_canvas()
+        first.putpixel((0, 0), (1, 2, 3))
+        second = generator._get_canvas()
+
+        assert second is first
+        # Reused canvas is cleared back to the background color
+        assert second.getpixel((0, 0)) == generator.COLORS["background"]
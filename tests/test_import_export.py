@@ -9,7 +9,7 @@ from sqlalchemy.orm import Session
 from app.main import app
 from app.models.user import User
 from app.models.token import Token
-from app.utils.password import hash_password
+from conftest import SUPERUSER_PASSWORD_HASH, USER_PASSWORD_HASH
 
 client = TestClient(app)
 
@@ -20,7 +20,7 @@ class TestImportExport:
     def _create_test_superuser(self, db_session: Session) -> tuple[User, Token]:
         """Create a test superuser and return user and token."""
         # Create superuser
-        hashed_password = hash_password("superpassword123")
+        hashed_password = SUPERUSER_PASSWORD_HASH
         user = User(
             username="superuser",
             hashed_password=hashed_password,
@@ -40,7 +40,7 @@ class TestImportExport:
     def _create_test_user(self, db_session: Session) -> tuple[User, Token]:
         """Create a test regular user and return user and token."""
         # Create regular user
-        hashed_password = hash_password("userpassword123")
+        hashed_password = USER_PASSWORD_HASH
         user = User(
             username="testuser",
             hashed_password=hashed_password,
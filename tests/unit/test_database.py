@@ -1,5 +1,7 @@
 # type: ignore[comparison-overlap,assignment]
 import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 from app import database
 from app.config import settings
@@ -32,3 +34,32 @@ def test_get_db_yields_session():
     assert isinstance(session, Session)
     with pytest.raises(StopIteration):
         next(gen)
+
+
+def test_get_db_shared_within_request(monkeypatch):
+    created = []
+
+    class FakeSession:
+        def close(self):
+            pass
+
+    def fake_session_local():
+        session = FakeSession()
+        created.append(session)
+        return session
+
+    monkeypatch.setattr(database, "SessionLocal", fake_session_local)
+
+    app = FastAPI()
+
+    def dependency(db=Depends(database.get_db)):
+        return db
+
+    @app.get("/")
+    def route(auth_db=Depends(dependency), db=Depends(database.get_db)):
+        return {"shared": auth_db is db}
+
+    response = TestClient(app).get("/")
+
+    assert response.json() == {"shared": True}
+    assert len(created) == 1
@@ -7,10 +7,11 @@ import pytest
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch
 from fastapi import HTTPException
+from sqlalchemy.exc import IntegrityError
 
 from app.utils.invite import (
     generate_invite_code,
-    ensure_unique_code,
+    create_unique_invite,
     validate_invite_code,
     use_invite_code,
     is_invite_expired,
@@ -62,59 +63,67 @@ class TestInviteCodeGeneration:
             )  # No more than 20 occurrences of any char at any position
 
 
-class TestEnsureUniqueCode:
-    def test_ensure_unique_code_success(self, db_session):
-        """Test successful unique code generation."""
-        with patch("app.utils.invite.generate_invite_code") as mock_generate:
-            mock_generate.side_effect = ["ABC12345", "DEF67890"]
+class TestCreateUniqueInvite:
+    def test_create_unique_invite_success(self, db_session):
+        """Test creating an invite persists it with a generated code."""
+        user = User(username="inviter", hashed_password="hashedpw123")
+        db_session.add(user)
+        db_session.commit()
 
-            # Mock database query to return None (no existing code)
-            with patch.object(db_session, "query") as mock_query:
-                mock_query.return_value.filter.return_value.first.return_value = (
-                    None
-                )
+        invite = create_unique_invite(db_session, created_by=user.id)
 
-                code = ensure_unique_code(db_session)
-                assert code == "ABC12345"
-                assert mock_generate.call_count == 1
+        assert invite.id is not None
+        assert len(invite.code) == 8
+        assert invite.created_by == user.id
+        assert invite.is_superuser_invite is False
+
+    def test_create_unique_invite_retry_on_collision(self, db_session):
+        """Test that a code collision is retried with a new code."""
+        user = User(username="inviter", hashed_password="hashedpw123")
+        db_session.add(user)
+        db_session.commit()
+        db_session.add(Invite(code="ABC12345", created_by=user.id))
+        db_session.commit()
 
-    def test_ensure_unique_code_retry_on_collision(self, db_session):
-        """Test that code generation retries on collision."""
         with patch("app.utils.invite.generate_invite_code") as mock_generate:
             mock_generate.side_effect = ["ABC12345", "DEF67890"]
 
-            # Mock database query to return existing code first, then None
-            with patch.object(db_session, "query") as mock_query:
-                mock_filter = Mock()
-                mock_query.return_value.filter.return_value = mock_filter
-                mock_filter.first.side_effect = [
-                    Mock(),
-                    None,
-                ]  # First call returns existing, second returns None
-
-                code = ensure_unique_code(db_session)
-                assert code == "DEF67890"
-                assert mock_generate.call_count == 2
-
-    def test_ensure_unique_code_max_attempts_exceeded(self, db_session):
-        """Test that error is raised when max attempts exceeded."""
-        with patch("app.utils.invite.generate_invite_code") as mock_generate:
-            mock_generate.return_value = "ABC12345"
+            invite = create_unique_invite(db_session, created_by=user.id)
 
-            # Mock database query to always return existing code
-            with patch.object(db_session, "query") as mock_query:
-                mock_query.return_value.filter.return_value.first.return_value = (
-                    Mock()
-                )
+            assert invite.code == "DEF67890"
+            assert mock_generate.call_count == 2
 
-                with pytest.raises(HTTPException) as exc_info:
-                    ensure_unique_code(db_session, max_attempts=3)
+    def test_create_unique_invite_max_attempts_exceeded(self, db_session):
+        """Test that error is raised when every attempt collides."""
+        user = User(username="inviter", hashed_password="hashedpw123")
+        db_session.add(user)
+        db_session.commit()
+        db_session.add(Invite(code="ABC12345", created_by=user.id))
+        db_session.commit()
 
-                assert exc_info.value.status_code == 500
-                assert "Unable to generate unique invite code" in str(
-                    exc_info.value.detail
+        with patch(
+            "app.utils.invite.generate_invite_code", return_value="ABC12345"
+        ):
+            with pytest.raises(HTTPException) as exc_info:
+                create_unique_invite(
+                    db_session, created_by=user.id, max_attempts=3
                 )
 
+            assert exc_info.value.status_code == 500
+
+    def test_create_unique_invite_other_integrity_error_not_retried(
+        self, db_session
+    ):
+        """Test that violations other than a code collision are re-raised."""
+        with patch("app.utils.invite.generate_invite_code") as mock_generate:
+            mock_generate.side_effect = ["ABC12345", "DEF67890"]
+
+            # No such user, so the created_by foreign key is violated
+            with pytest.raises(IntegrityError):
+                create_unique_invite(db_session, created_by=999999)
+
+            assert mock_generate.call_count == 1
+
 
 class TestCalculateExpirationDate:
     def test_calculate_expiration_date_with_days(self):
@@ -236,9 +245,11 @@ class TestValidateInviteCode:
         )
 
         with patch.object(db_session, "query") as mock_query:
-            mock_query.return_value.filter.return_value.first.return_value = (
-                invite
-            )
+            # Filtered lookup misses, status lookup returns the invite
+            mock_query.return_value.filter.return_value.first.side_effect = [
+                None,
+                invite,
+            ]
 
             with pytest.raises(HTTPException) as exc_info:
                 validate_invite_code("ABC12345", db_session)
@@ -257,9 +268,11 @@ class TestValidateInviteCode:
         )
 
         with patch.object(db_session, "query") as mock_query:
-            mock_query.return_value.filter.return_value.first.return_value = (
-                invite
-            )
+            # Filtered lookup misses, status lookup returns the invite
+            mock_query.return_value.filter.return_value.first.side_effect = [
+                None,
+                invite,
+            ]
 
             with pytest.raises(HTTPException) as exc_info:
                 validate_invite_code("ABC12345", db_session)
@@ -277,9 +290,11 @@ class TestValidateInviteCode:
         )
 
         with patch.object(db_session, "query") as mock_query:
-            mock_query.return_value.filter.return_value.first.return_value = (
-                invite
-            )
+            # Filtered lookup misses, status lookup returns the invite
+            mock_query.return_value.filter.return_value.first.side_effect = [
+                None,
+                invite,
+            ]
 
             with pytest.raises(HTTPException) as exc_info:
                 validate_invite_code("ABC12345", db_session)
@@ -29,3 +29,16 @@ def test_logger_logs_to_file(tmp_path, monkeypatch):
     with open(log_file, "r") as f:
         contents = f.read()
     assert test_message in contents
+
+
+def test_get_logger_does_not_duplicate_handlers():
+    logger = get_logger("test_logger_repeat")
+    handler_count = len(logger.handlers)
+    assert get_logger("test_logger_repeat") is logger
+    assert len(logger.handlers) == handler_count
+
+
+def test_loggers_share_handlers():
+    first = get_logger("test_logger_shared_a")
+    second = get_logger("test_logger_shared_b")
+    assert set(first.handlers) == set(second.handlers)
@@ -3,10 +3,14 @@
 Unit tests for password hashing utilities.
 """
 
+import asyncio
+
 import pytest
 from app.utils.password import (
     hash_password,
+    hash_password_async,
     verify_password,
+    verify_password_async,
     generate_salt,
     needs_rehash,
     get_password_hash_info,
@@ -40,6 +44,14 @@ class TestPasswordHashing:
         assert parts[0] == "sha256"
         assert parts[1] == str(ITERATIONS)
 
+    def test_hash_password_custom_iterations(self):
+        """Test that a custom iteration count is stored and still verifies."""
+        password = "testpassword123"
+        hashed = hash_password(password, iterations=1000)
+
+        assert hashed.split("$")[1] == "1000"
+        assert verify_password(password, hashed) is True
+
     def test_verify_password_correct(self):
         """Test that password verification works with correct password."""
         password = "testpassword123"
@@ -159,6 +171,17 @@ class TestPasswordHashing:
         assert verify_password("p@ssw0rd", hashed) is False
 
 
+class TestAsyncHelpers:
+    def test_hash_and_verify_async(self):
+        """Test that the async helpers round-trip with the sync ones."""
+        password = "testpassword123"
+        hashed = asyncio.run(hash_password_async(password))
+
+        assert verify_password(password, hashed) is True
+        assert asyncio.run(verify_password_async(password, hashed)) is True
+        assert asyncio.run(verify_password_async("wrong", hashed)) is False
+
+
 class TestSaltGeneration:
     def test_generate_salt(self):
         """Test that salt generation works correctly."""
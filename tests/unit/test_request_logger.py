@@ -0,0 +1,155 @@
+"""
+Unit tests for the request logging middleware.
+"""
+
+import asyncio
+import logging
+from unittest.mock import patch
+
+from app.utils.request_logger import RequestLoggingMiddleware
+
+
+def _make_app(status_code):
+    async def app(scope, receive, send):
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status_code,
+                "headers": [],
+            }
+        )
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    return app
+
+
+def _message(call, offset=0):
+    """Render the lazily formatted message of a logger mock call."""
+    log_format, *args = call.args[offset:]
+    return log_format % tuple(args)
+
+
+def _run(middleware, headers=None, path="/guilds/"):
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "headers": headers or [],
+    }
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(middleware(scope, receive, send))
+    return sent
+
+
+class TestRequestLoggingMiddleware:
+    def test_passes_response_through(self):
+        """Test that response messages reach the client unchanged."""
+        middleware = RequestLoggingMiddleware(_make_app(200))
+
+        with patch("app.utils.request_logger.logger"):
+            sent = _run(middleware)
+
+        assert sent[0]["status"] == 200
+        assert sent[1]["body"] == b"ok"
+
+    def test_logs_request_and_response(self):
+        """Test that the request and response status are logged."""
+        middleware = RequestLoggingMiddleware(_make_app(200))
+
+        with patch("app.utils.request_logger.logger") as mock_logger:
+            _run(middleware)
+
+        assert _message(mock_logger.info.call_args) == "Request: GET /guilds/"
+        assert mock_logger.log.call_args.args[0] == logging.INFO
+        assert _message(mock_logger.log.call_args, 1).startswith(
+            "Response: GET /guilds/ -> 200"
+        )
+
+    def test_error_status_logged_as_error(self):
+        """Test that 5xx responses are logged at error level."""
+        middleware = RequestLoggingMiddleware(_make_app(503))
+
+        with patch("app.utils.request_logger.logger") as mock_logger:
+            _run(middleware)
+
+        assert mock_logger.log.call_args.args[0] == logging.ERROR
+        assert "-> 503" in _message(mock_logger.log.call_args, 1)
+
+    def test_client_error_logged_as_warning(self):
+        """Test that 4xx responses are logged at warning level."""
+        middleware = RequestLoggingMiddleware(_make_app(404))
+
+        with patch("app.utils.request_logger.logger") as mock_logger:
+            _run(middleware)
+
+        assert mock_logger.log.call_args.args[0] == logging.WARNING
+
+    def test_frontend_context_logged(self):
+        """Test that frontend requests include route and referer."""
+        middleware = RequestLoggingMiddleware(_make_app(200))
+        headers = [
+            (b"user-agent", b"GuildRoster-Frontend/1.0"),
+            (b"referer", b"http://localhost:5173/raids"),
+            (b"x-frontend-route", b"/raids"),
+        ]
+
+        with patch("app.utils.request_logger.logger") as mock_logger:
+            _run(middleware, headers=headers)
+
+        request_message = _message(mock_logger.info.call_args)
+        assert "Frontend Route: /raids" in request_message
+        assert "Referer: http://localhost:5173/raids" in request_message
+
+    def test_non_http_scope_passed_through(self):
+        """Test that non-HTTP scopes bypass logging."""
+        calls = []
+
+        async def app(scope, receive, send):
+            calls.append(scope["type"])
+
+        middleware = RequestLoggingMiddleware(app)
+
+        with patch("app.utils.request_logger.logger") as mock_logger:
+            asyncio.run(middleware({"type": "lifespan"}, None, None))
+
+        assert calls == ["lifespan"]
+        mock_logger.info.assert_not_called()
+        mock_logger.log.assert_not_called()
+
+    def test_quiet_path_logged_at_debug(self):
+        """Test that health/static paths skip the request log line."""
+        middleware = RequestLoggingMiddleware(_make_app(200))
+
+        with patch("app.utils.request_logger.logger") as mock_logger:
+            _run(middleware, path="/static/app.js")
+
+        mock_logger.info.assert_not_called()
+        assert mock_logger.log.call_args.args[0] == logging.DEBUG
+
+    def test_quiet_path_errors_still_reported(self):
+        """Test that failing health checks keep their error level."""
+        middleware = RequestLoggingMiddleware(_make_app(500))
+
+        with patch("app.utils.request_logger.logger") as mock_logger:
+            _run(middleware, path="/health")
+
+        assert mock_logger.log.call_args.args[0] == logging.ERROR
+
+    def test_frontend_context_defaults_to_unknown(self):
+        """Test that missing frontend headers are logged as Unknown."""
+        middleware = RequestLoggingMiddleware(_make_app(200))
+        headers = [(b"user-agent", b"GuildRoster-Frontend/1.0")]
+
+        with patch("app.utils.request_logger.logger") as mock_logger:
+            _run(middleware, headers=headers)
+
+        request_message = _message(mock_logger.info.call_args)
+        assert "Frontend Route: Unknown" in request_message
+        assert "Referer: Unknown" in request_message
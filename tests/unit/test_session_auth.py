@@ -1,9 +1,12 @@
 import pytest
 from unittest.mock import Mock, patch
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 from fastapi import HTTPException
 
 from app.utils.session_auth import (
+    clear_session_cache,
+    get_session_and_user_from_cookie,
     get_session_from_cookie,
     get_current_session,
     get_current_user,
@@ -13,6 +16,13 @@ from app.models.session import Session as SessionModel
 from app.models.user import User
 
 
+@pytest.fixture(autouse=True)
+def reset_session_cache():
+    clear_session_cache()
+    yield
+    clear_session_cache()
+
+
 class TestSessionAuth:
     def setup_user(self) -> User:
         """Create a test user."""
@@ -35,6 +45,14 @@ class TestSessionAuth:
             is_active=True,
         )
 
+    def setup_request(self, auth_pair=None) -> Mock:
+        """Create a request mock with an optional cached auth pair."""
+        request = Mock()
+        request.state = SimpleNamespace()
+        if auth_pair is not None:
+            request.state.auth_pair = auth_pair
+        return request
+
     @patch("app.utils.session_auth.get_db")
     def test_get_session_from_cookie_valid_session(self, mock_get_db):
         """Test getting a valid session from cookie."""
@@ -44,11 +62,10 @@ class TestSessionAuth:
         # Mock request and database
         mock_request = Mock()
         mock_request.cookies.get.return_value = "test_session_id"
+        mock_request.state = SimpleNamespace()
 
         mock_db = Mock()
-        mock_db.query.return_value.filter.return_value.first.return_value = (
-            session
-        )
+        mock_db.execute.return_value.first.return_value = (session, user)
         mock_get_db.return_value = mock_db
 
         result = get_session_from_cookie(mock_request, mock_db)
@@ -61,6 +78,7 @@ class TestSessionAuth:
         """Test getting session when no cookie is present."""
         mock_request = Mock()
         mock_request.cookies.get.return_value = None
+        mock_request.state = SimpleNamespace()
 
         mock_db = Mock()
         mock_get_db.return_value = mock_db
@@ -75,9 +93,10 @@ class TestSessionAuth:
         """Test getting session when session is not found in database."""
         mock_request = Mock()
         mock_request.cookies.get.return_value = "invalid_session_id"
+        mock_request.state = SimpleNamespace()
 
         mock_db = Mock()
-        mock_db.query.return_value.filter.return_value.first.return_value = None
+        mock_db.execute.return_value.first.return_value = None
         mock_get_db.return_value = mock_db
 
         result = get_session_from_cookie(mock_request, mock_db)
@@ -93,11 +112,10 @@ class TestSessionAuth:
 
         mock_request = Mock()
         mock_request.cookies.get.return_value = "test_session_id"
+        mock_request.state = SimpleNamespace()
 
         mock_db = Mock()
-        mock_db.query.return_value.filter.return_value.first.return_value = (
-            session
-        )
+        mock_db.execute.return_value.first.return_value = (session, user)
         mock_get_db.return_value = mock_db
 
         result = get_session_from_cookie(mock_request, mock_db)
@@ -113,18 +131,17 @@ class TestSessionAuth:
 
         mock_request = Mock()
         mock_request.cookies.get.return_value = "test_session_id"
+        mock_request.state = SimpleNamespace()
 
         mock_db = Mock()
-        mock_db.query.return_value.filter.return_value.first.return_value = (
-            session
-        )
+        mock_db.execute.return_value.first.return_value = (session, user)
         mock_get_db.return_value = mock_db
 
         result = get_session_from_cookie(mock_request, mock_db)
 
         assert result is None
 
-    @patch("app.utils.session_auth.get_session_from_cookie")
+    @patch("app.utils.session_auth.get_session_and_user_from_cookie")
     def test_get_current_session_valid(self, mock_get_session):
         """Test getting current session with valid session."""
         user = self.setup_user()
@@ -132,14 +149,14 @@ class TestSessionAuth:
 
         mock_request = Mock()
         mock_db = Mock()
-        mock_get_session.return_value = session
+        mock_get_session.return_value = (session, user)
 
         result = get_current_session(mock_request, mock_db)
 
         assert result == session
         mock_get_session.assert_called_once_with(mock_request, mock_db)
 
-    @patch("app.utils.session_auth.get_session_from_cookie")
+    @patch("app.utils.session_auth.get_session_and_user_from_cookie")
     def test_get_current_session_invalid(self, mock_get_session):
         """Test getting current session with invalid session."""
         mock_request = Mock()
@@ -162,7 +179,7 @@ class TestSessionAuth:
         mock_db.query.return_value.filter.return_value.first.return_value = user
         mock_get_db.return_value = mock_db
 
-        result = get_current_user(session, mock_db)
+        result = get_current_user(self.setup_request(), session, mock_db)
 
         assert result == user
         mock_db.query.assert_called_once()
@@ -177,7 +194,7 @@ class TestSessionAuth:
         mock_get_db.return_value = mock_db
 
         with pytest.raises(HTTPException) as exc_info:
-            get_current_user(session, mock_db)
+            get_current_user(self.setup_request(), session, mock_db)
 
         assert exc_info.value.status_code == 401
         assert exc_info.value.detail == "User not found"
@@ -194,11 +211,69 @@ class TestSessionAuth:
         mock_get_db.return_value = mock_db
 
         with pytest.raises(HTTPException) as exc_info:
-            get_current_user(session, mock_db)
+            get_current_user(self.setup_request(), session, mock_db)
 
         assert exc_info.value.status_code == 401
         assert exc_info.value.detail == "User is inactive"
 
+    def test_session_and_user_fetched_in_one_query(self):
+        """Test that the session and user come from a single joined query."""
+        user = self.setup_user()
+        session = self.setup_session(user)
+        mock_request = self.setup_request()
+        mock_request.cookies.get.return_value = "test_session_id"
+
+        mock_db = Mock()
+        mock_db.execute.return_value.first.return_value = (session, user)
+
+        result = get_session_and_user_from_cookie(mock_request, mock_db)
+
+        assert result == (session, user)
+        assert mock_request.state.auth_pair == (session, user)
+        mock_db.execute.assert_called_once()
+        assert mock_db.execute.call_args.args[1] == {
+            "session_id": "test_session_id"
+        }
+
+    def test_session_and_user_reused_within_request(self):
+        """Test that a cached auth pair is reused without querying."""
+        user = self.setup_user()
+        session = self.setup_session(user)
+        mock_request = self.setup_request(auth_pair=(session, user))
+        mock_db = Mock()
+
+        assert get_session_and_user_from_cookie(mock_request, mock_db) == (
+            session,
+            user,
+        )
+        assert get_current_user(mock_request, session, mock_db) == user
+        mock_db.execute.assert_not_called()
+        mock_db.query.assert_not_called()
+
+    def test_session_lookup_cached_across_requests(self):
+        """Test that a later request with the same cookie skips the query."""
+        user = self.setup_user()
+        session = self.setup_session(user)
+
+        first_request = self.setup_request()
+        first_request.cookies.get.return_value = "test_session_id"
+        first_db = Mock()
+        first_db.execute.return_value.first.return_value = (session, user)
+        get_session_and_user_from_cookie(first_request, first_db)
+
+        second_request = self.setup_request()
+        second_request.cookies.get.return_value = "test_session_id"
+        second_db = Mock()
+        second_db.merge.side_effect = lambda instance, load: instance
+
+        cached_session, cached_user = get_session_and_user_from_cookie(
+            second_request, second_db
+        )
+
+        second_db.execute.assert_not_called()
+        assert cached_session.session_id == "test_session_id"
+        assert cached_user.username == "testuser"
+
     def test_require_user_valid(self):
         """Test require_user with valid user."""
         user = self.setup_user()
@@ -1,11 +1,18 @@
+import json
 import pytest
 import requests
+import time
 from unittest.mock import Mock, patch, MagicMock
+from urllib3 import HTTPResponse
 from app.utils.warcraftlogs import (
     extract_report_code,
     fetch_report_metadata,
     fetch_report_participants,
     fetch_report_fights,
+    fuzzy_match_username,
+    match_participants_to_toons,
+    process_warcraftlogs_raid,
+    process_warcraftlogs_raids,
     WarcraftLogsAPI,
 )
 
@@ -55,6 +62,108 @@ class TestExtractReportCode:
             assert len(result) == 12
 
 
+class TestFuzzyMatchUsername:
+    """Test fuzzy username matching."""
+
+    def test_matches_special_characters(self):
+        """Test that accented names match their plain spelling."""
+        result = fuzzy_match_username("Thràll", ["Jaina", "Thrall"])
+
+        assert result == "Thrall"
+
+    def test_returns_original_candidate(self):
+        """Test that the original, unnormalized candidate is returned."""
+        result = fuzzy_match_username("sylvanas", ["Jaina", "Sylvânas"])
+
+        assert result == "Sylvânas"
+
+    def test_no_match_below_threshold(self):
+        """Test that dissimilar names are not matched."""
+        assert fuzzy_match_username("Arthas", ["Jaina", "Thrall"]) is None
+        assert fuzzy_match_username("Arthas", []) is None
+
+
+class TestMatchParticipantsToToons:
+    """Test matching report participants to team toons."""
+
+    def test_matches_present_absent_and_unknown(self):
+        """Test exact, case-insensitive and missing matches."""
+        team_toons = [
+            {"id": 1, "username": "Thrall"},
+            {"id": 2, "username": "Jaina"},
+            {"id": 3, "username": "Anduin"},
+        ]
+        participants = [{"name": "thrall"}, {"name": "Jaina"}, {"name": "Zzz"}]
+
+        matched, unmatched, unknown = match_participants_to_toons(
+            participants, team_toons
+        )
+
+        present = [m["toon"]["id"] for m in matched if m["is_present"]]
+        absent = [m["toon"]["id"] for m in matched if not m["is_present"]]
+        assert present == [1, 2]
+        assert absent == [3]
+        assert unmatched == [{"id": 3, "username": "Anduin"}]
+        assert [u["participant"]["name"] for u in unknown] == ["Zzz"]
+
+    def test_fuzzy_match_returns_toon(self):
+        """Test that a near-miss name is fuzzy matched to its toon."""
+        team_toons = [
+            {"id": 1, "username": "Jaina"},
+            {"id": 2, "username": "Thrall"},
+        ]
+
+        matched, unmatched, unknown = match_participants_to_toons(
+            [{"name": "Thràll"}], team_toons
+        )
+
+        assert matched[0]["toon"] == {"id": 2, "username": "Thrall"}
+        assert matched[0]["is_present"] is True
+        assert unmatched == [{"id": 1, "username": "Jaina"}]
+        assert unknown == []
+
+    @patch("app.utils.warcraftlogs.fuzzy_match_normalized")
+    def test_normalized_exact_match_skips_fuzzy(self, mock_fuzzy):
+        """Test that names differing only in case/punctuation match directly."""
+        team_toons = [{"id": 1, "username": "Mal'Ganis"}]
+
+        matched, unmatched, unknown = match_participants_to_toons(
+            [{"name": "malganis"}], team_toons
+        )
+
+        assert matched[0]["toon"]["id"] == 1
+        assert matched[0]["is_present"] is True
+        mock_fuzzy.assert_not_called()
+
+    @patch("app.utils.warcraftlogs.normalize_username")
+    def test_empty_team_skips_matching(self, mock_normalize):
+        """Test that an empty team marks everyone unknown without matching."""
+        matched, unmatched, unknown = match_participants_to_toons(
+            [{"name": "Thrall"}, {"name": "Jaina"}], []
+        )
+
+        assert matched == []
+        assert unmatched == []
+        assert [u["notes"] for u in unknown] == [
+            "Unknown participant: Thrall",
+            "Unknown participant: Jaina",
+        ]
+        mock_normalize.assert_not_called()
+
+    def test_toon_matched_only_once(self):
+        """Test that a toon can't be claimed by two participants."""
+        team_toons = [{"id": 1, "username": "Thrall"}]
+        participants = [{"name": "Thrall"}, {"name": "THRALL"}]
+
+        matched, unmatched, unknown = match_participants_to_toons(
+            participants, team_toons
+        )
+
+        assert len(matched) == 1
+        assert unmatched == []
+        assert [u["participant"]["name"] for u in unknown] == ["THRALL"]
+
+
 class TestWarcraftLogsAPI:
     """Test WarcraftLogs API client functionality."""
 
@@ -72,17 +181,19 @@ class TestWarcraftLogsAPI:
             )
             return WarcraftLogsAPI()
 
-    @patch("app.utils.warcraftlogs.requests.post")
+    @patch("app.utils.warcraftlogs.requests.Session.post")
     def test_token_acquisition_success(self, mock_post, api_client):
         """Test successful token acquisition."""
         # Mock successful token response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "access_token": "test_access_token",
-            "expires_in": 3600,
-            "token_type": "Bearer",
-        }
+        mock_response.content = json.dumps(
+            {
+                "access_token": "test_access_token",
+                "expires_in": 3600,
+                "token_type": "Bearer",
+            }
+        ).encode()
         mock_post.return_value = mock_response
 
         # Test token acquisition
@@ -92,7 +203,32 @@ class TestWarcraftLogsAPI:
         assert api_client._access_token == "test_access_token"
         assert api_client._token_expires_at > 0
 
-    @patch("app.utils.warcraftlogs.requests.post")
+    @patch("app.utils.warcraftlogs.requests.Session.post")
+    def test_requests_use_timeouts(self, mock_post, api_client):
+        """Test that token and API calls pass connect/read timeouts."""
+        token_response = Mock()
+        token_response.content = json.dumps(
+            {"access_token": "test_access_token", "expires_in": 3600}
+        ).encode()
+        api_response = Mock()
+        api_response.content = json.dumps({"data": {}}).encode()
+        mock_post.side_effect = [token_response, api_response]
+
+        api_client._make_api_request("query { test }")
+
+        for call in mock_post.call_args_list:
+            assert call.kwargs["timeout"] == (3.05, 15)
+
+    @patch("app.utils.warcraftlogs.requests.Session.post")
+    def test_api_request_timeout(self, mock_post, api_client):
+        """Test that a timed out API request returns None."""
+        api_client._access_token = "test_access_token"
+        api_client._token_expires_at = time.time() + 3600
+        mock_post.side_effect = requests.exceptions.Timeout("read timed out")
+
+        assert api_client._make_api_request("query { test }") is None
+
+    @patch("app.utils.warcraftlogs.requests.Session.post")
     def test_token_acquisition_failure(self, mock_post, api_client):
         """Test token acquisition failure."""
         # Mock failed token response
@@ -109,17 +245,19 @@ class TestWarcraftLogsAPI:
         assert token is None
         assert api_client._access_token is None
 
-    @patch("app.utils.warcraftlogs.requests.post")
+    @patch("app.utils.warcraftlogs.requests.Session.post")
     def test_token_caching(self, mock_post, api_client):
         """Test that tokens are cached and reused."""
         # Mock successful token response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "access_token": "test_access_token",
-            "expires_in": 3600,
-            "token_type": "Bearer",
-        }
+        mock_response.content = json.dumps(
+            {
+                "access_token": "test_access_token",
+                "expires_in": 3600,
+                "token_type": "Bearer",
+            }
+        ).encode()
         mock_post.return_value = mock_response
 
         # Get token twice
@@ -130,7 +268,41 @@ class TestWarcraftLogsAPI:
         assert mock_post.call_count == 1
         assert token1 == token2 == "test_access_token"
 
-    @patch("app.utils.warcraftlogs.requests.post")
+    @patch("app.utils.warcraftlogs.requests.Session.post")
+    def test_token_refreshed_once_under_concurrency(
+        self, mock_post, api_client
+    ):
+        """Test that concurrent callers share a single token refresh."""
+        import threading
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps(
+            {
+                "access_token": "test_access_token",
+                "expires_in": 3600,
+                "token_type": "Bearer",
+            }
+        ).encode()
+        mock_post.return_value = mock_response
+
+        tokens = []
+        threads = [
+            threading.Thread(
+                target=lambda: tokens.append(api_client._get_access_token())
+            )
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert mock_post.call_count == 1
+        assert tokens == ["test_access_token"] * 8
+        assert api_client.token_refresh_count == 1
+
+    @patch("app.utils.warcraftlogs.requests.Session.post")
     def test_api_request_success(self, mock_post, api_client):
         """Test successful API request."""
         # Mock token acquisition
@@ -140,19 +312,21 @@ class TestWarcraftLogsAPI:
         # Mock successful API response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "data": {
-                "reportData": {
-                    "report": {
-                        "title": "Test Report",
-                        "startTime": 1234567890,
-                        "endTime": 1234567890,
-                        "owner": {"name": "Test Owner"},
-                        "zone": {"name": "Test Zone"},
+        mock_response.content = json.dumps(
+            {
+                "data": {
+                    "reportData": {
+                        "report": {
+                            "title": "Test Report",
+                            "startTime": 1234567890,
+                            "endTime": 1234567890,
+                            "owner": {"name": "Test Owner"},
+                            "zone": {"name": "Test Zone"},
+                        }
                     }
                 }
             }
-        }
+        ).encode()
         mock_post.return_value = mock_response
 
         # Test API request
@@ -162,7 +336,50 @@ class TestWarcraftLogsAPI:
         assert result is not None
         assert result["data"]["reportData"]["report"]["title"] == "Test Report"
 
-    @patch("app.utils.warcraftlogs.requests.post")
+    @patch("app.utils.warcraftlogs.requests.Session.post")
+    def test_api_request_sends_variables(self, mock_post, api_client):
+        """Test that report codes are sent as GraphQL variables."""
+        api_client._access_token = "test_token"
+        api_client._token_expires_at = 9999999999  # Far future
+
+        mock_response = Mock()
+        mock_response.content = json.dumps(
+            {"data": {"reportData": {"report": {"title": "Test Report"}}}}
+        ).encode()
+        mock_post.return_value = mock_response
+
+        api_client.get_report_metadata("abc123")
+
+        payload = json.loads(mock_post.call_args.kwargs["data"])
+        assert payload["variables"] == {"code": "abc123"}
+        assert "abc123" not in payload["query"]
+        assert "report(code: $code)" in payload["query"]
+
+    @patch("app.utils.warcraftlogs.requests.Session.post")
+    def test_api_request_refreshes_rejected_token(self, mock_post, api_client):
+        """Test that a 401 refreshes the token and retries once."""
+        api_client._access_token = "stale_token"
+        api_client._token_expires_at = 9999999999  # Far future
+
+        rejected = Mock()
+        rejected.status_code = 401
+        token_response = Mock()
+        token_response.content = json.dumps(
+            {"access_token": "fresh_token", "expires_in": 3600}
+        ).encode()
+        ok = Mock()
+        ok.status_code = 200
+        ok.content = json.dumps({"data": {"ok": True}}).encode()
+        mock_post.side_effect = [rejected, token_response, ok]
+
+        result = api_client._make_api_request("query { test }")
+
+        assert result == {"data": {"ok": True}}
+        assert api_client._access_token == "fresh_token"
+        retry_headers = mock_post.call_args_list[2].kwargs["headers"]
+        assert retry_headers["Authorization"] == "Bearer fresh_token"
+
+    @patch("app.utils.warcraftlogs.requests.Session.post")
     def test_api_request_failure(self, mock_post, api_client):
         """Test API request failure."""
         # Mock token acquisition
@@ -183,7 +400,7 @@ class TestWarcraftLogsAPI:
 
         assert result is None
 
-    @patch("app.utils.warcraftlogs.requests.post")
+    @patch("app.utils.warcraftlogs.requests.Session.post")
     def test_get_report_metadata_success(self, mock_post, api_client):
         """Test successful report metadata retrieval."""
         # Mock token acquisition
@@ -193,19 +410,21 @@ class TestWarcraftLogsAPI:
         # Mock successful API response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "data": {
-                "reportData": {
-                    "report": {
-                        "title": "Test Report",
-                        "startTime": 1234567890,
-                        "endTime": 1234567890,
-                        "owner": {"name": "Test Owner"},
-                        "zone": {"name": "Test Zone"},
+        mock_response.content = json.dumps(
+            {
+                "data": {
+                    "reportData": {
+                        "report": {
+                            "title": "Test Report",
+                            "startTime": 1234567890,
+                            "endTime": 1234567890,
+                            "owner": {"name": "Test Owner"},
+                            "zone": {"name": "Test Zone"},
+                        }
                     }
                 }
             }
-        }
+        ).encode()
         mock_post.return_value = mock_response
 
         # Test metadata retrieval
@@ -216,7 +435,7 @@ class TestWarcraftLogsAPI:
         assert result["owner"]["name"] == "Test Owner"
         assert result["zone"]["name"] == "Test Zone"
 
-    @patch("app.utils.warcraftlogs.requests.post")
+    @patch("app.utils.warcraftlogs.requests.Session.post")
     def test_get_report_participants_success(self, mock_post, api_client):
         """Test successful participant data retrieval."""
         # Mock token acquisition
@@ -226,31 +445,33 @@ class TestWarcraftLogsAPI:
         # Mock successful API response with participant data
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "data": {
-                "reportData": {
-                    "report": {
-                        "title": "Test Report",
-                        "startTime": 1234567890,
-                        "endTime": 1234567890,
-                        "rankedCharacters": [
-                            {
-                                "id": 123,
-                                "canonicalID": 123,
-                                "name": "TestPlayer1",
-                                "classID": 11,
-                            },
-                            {
-                                "id": 456,
-                                "canonicalID": 456,
-                                "name": "TestPlayer2",
-                                "classID": 8,
-                            },
-                        ],
+        mock_response.content = json.dumps(
+            {
+                "data": {
+                    "reportData": {
+                        "report": {
+                            "title": "Test Report",
+                            "startTime": 1234567890,
+                            "endTime": 1234567890,
+                            "rankedCharacters": [
+                                {
+                                    "id": 123,
+                                    "canonicalID": 123,
+                                    "name": "TestPlayer1",
+                                    "classID": 11,
+                                },
+                                {
+                                    "id": 456,
+                                    "canonicalID": 456,
+                                    "name": "TestPlayer2",
+                                    "classID": 8,
+                                },
+                            ],
+                        }
                     }
                 }
             }
-        }
+        ).encode()
         mock_post.return_value = mock_response
 
         # Test participant retrieval
@@ -265,7 +486,7 @@ class TestWarcraftLogsAPI:
         assert result[1]["class"] == "Rogue"
         assert result[1]["classID"] == 8
 
-    @patch("app.utils.warcraftlogs.requests.post")
+    @patch("app.utils.warcraftlogs.requests.Session.post")
     def test_get_report_fights_success(self, mock_post, api_client):
         """Test successful fight data retrieval."""
         # Mock token acquisition
@@ -275,39 +496,41 @@ class TestWarcraftLogsAPI:
         # Mock successful API response with fight data
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "data": {
-                "reportData": {
-                    "report": {
-                        "title": "Test Report",
-                        "fights": [
-                            {
-                                "id": 1,
-                                "name": "Test Boss 1",
-                                "startTime": 1234567890,
-                                "endTime": 1234567890,
-                                "difficulty": "Mythic",
-                                "kill": True,
-                                "encounterID": 1001,
-                                "averageItemLevel": 447,
-                                "bossPercentage": 100.0,
-                            },
-                            {
-                                "id": 2,
-                                "name": "Test Boss 2",
-                                "startTime": 1234567890,
-                                "endTime": 1234567890,
-                                "difficulty": "Mythic",
-                                "kill": False,
-                                "encounterID": 1002,
-                                "averageItemLevel": 447,
-                                "bossPercentage": 45.2,
-                            },
-                        ],
+        mock_response.content = json.dumps(
+            {
+                "data": {
+                    "reportData": {
+                        "report": {
+                            "title": "Test Report",
+                            "fights": [
+                                {
+                                    "id": 1,
+                                    "name": "Test Boss 1",
+                                    "startTime": 1234567890,
+                                    "endTime": 1234567890,
+                                    "difficulty": "Mythic",
+                                    "kill": True,
+                                    "encounterID": 1001,
+                                    "averageItemLevel": 447,
+                                    "bossPercentage": 100.0,
+                                },
+                                {
+                                    "id": 2,
+                                    "name": "Test Boss 2",
+                                    "startTime": 1234567890,
+                                    "endTime": 1234567890,
+                                    "difficulty": "Mythic",
+                                    "kill": False,
+                                    "encounterID": 1002,
+                                    "averageItemLevel": 447,
+                                    "bossPercentage": 45.2,
+                                },
+                            ],
+                        }
                     }
                 }
             }
-        }
+        ).encode()
         mock_post.return_value = mock_response
 
         # Test fight retrieval
@@ -322,6 +545,29 @@ class TestWarcraftLogsAPI:
         assert result[1]["kill"] is False
         assert result[1]["bossPercentage"] == 45.2
 
+    def test_session_uses_pooled_adapter(self, api_client):
+        """Test that the client reuses one pooled HTTPS session."""
+        adapter = api_client._session.get_adapter("https://test.com")
+
+        assert adapter._pool_maxsize == 16
+        assert adapter.max_retries.total == 5
+        assert "POST" in adapter.max_retries.allowed_methods
+        assert adapter.max_retries.respect_retry_after_header is True
+        assert api_client._session.get_adapter("http://test.com") is adapter
+
+    def test_retry_after_is_capped(self, api_client):
+        """Test that a long Retry-After header doesn't stall a worker."""
+        retry = api_client._session.get_adapter("https://test.com").max_retries
+
+        long_wait = HTTPResponse(headers={"Retry-After": "600"}, status=429)
+        short_wait = HTTPResponse(headers={"Retry-After": "2"}, status=429)
+
+        assert retry.get_retry_after(long_wait) == 10
+        assert retry.get_retry_after(short_wait) == 2
+        # The cap survives the copy urllib3 makes on every retry
+        next_retry = retry.increment("POST", "/", response=short_wait)
+        assert next_retry.get_retry_after(long_wait) == 10
+
     def test_class_name_conversion(self, api_client):
         """Test class ID to class name conversion."""
         # Test all class mappings by creating a mock participant and processing it
@@ -361,10 +607,13 @@ class TestWarcraftLogsAPI:
             }
 
             # Test the conversion by mocking the API call and checking the result
+            # Use a distinct report code per class so results aren't cached
             with patch.object(
                 api_client, "_make_api_request", return_value=mock_response_data
             ):
-                result = api_client.get_report_participants("test123")
+                result = api_client.get_report_participants(
+                    f"test{class_id}"
+                )
 
                 assert result is not None
                 assert len(result) == 1
@@ -403,6 +652,173 @@ class TestWarcraftLogsAPI:
             assert result[0]["class"] == "Unknown"
             assert result[0]["classID"] == 999
 
+    def test_report_metadata_is_cached(self, api_client):
+        """Test that repeated metadata lookups reuse the cached result."""
+        mock_response_data = {
+            "data": {"reportData": {"report": {"title": "Test Report"}}}
+        }
+
+        with patch.object(
+            api_client, "_make_api_request", return_value=mock_response_data
+        ) as mock_request:
+            first = api_client.get_report_metadata("test123")
+            second = api_client.get_report_metadata("test123")
+
+        assert first == second == {"title": "Test Report"}
+        assert mock_request.call_count == 1
+
+    def test_failed_lookup_is_not_cached(self, api_client):
+        """Test that failed lookups are retried rather than cached."""
+        with patch.object(
+            api_client, "_make_api_request", return_value=None
+        ) as mock_request:
+            assert api_client.get_report_fights("test123") is None
+            assert api_client.get_report_fights("test123") is None
+
+        assert mock_request.call_count == 2
+
+    def test_invalidate_report_forces_refetch(self, api_client):
+        """Test that invalidating a report drops its cached data."""
+        mock_response_data = {
+            "data": {"reportData": {"report": {"title": "Test Report"}}}
+        }
+
+        with patch.object(
+            api_client, "_make_api_request", return_value=mock_response_data
+        ) as mock_request:
+            api_client.get_report_metadata("test123")
+            api_client.invalidate_report("test123")
+            api_client.get_report_metadata("test123")
+
+        assert mock_request.call_count == 2
+
+    def test_report_cache_ttl(self, api_client):
+        """Test that recently ended reports are only cached briefly."""
+        now_ms = time.time() * 1000
+
+        assert api_client._report_cache_ttl({"endTime": now_ms}) == 60
+        assert api_client._report_cache_ttl({"endTime": None}) == 60
+        assert (
+            api_client._report_cache_ttl({"endTime": now_ms - 86_400_000})
+            is None
+        )
+
+    def test_live_report_fights_and_participants_use_short_ttl(
+        self, api_client
+    ):
+        """Test that fights and participants of a live report expire quickly."""
+        mock_response_data = {
+            "data": {
+                "reportData": {
+                    "report": {
+                        "endTime": None,
+                        "fights": [{"id": 1, "name": "Test Boss"}],
+                        "rankedCharacters": [
+                            {"id": 1, "canonicalID": 1, "name": "A", "classID": 1}
+                        ],
+                    }
+                }
+            }
+        }
+
+        with patch.object(
+            api_client, "_make_api_request", return_value=mock_response_data
+        ), patch.object(
+            api_client._fights_cache, "set"
+        ) as fights_set, patch.object(
+            api_client._participants_cache, "set"
+        ) as participants_set:
+            api_client.get_report_fights("test123")
+            api_client.get_report_participants("test123")
+
+        assert fights_set.call_args.kwargs["ttl"] == 60
+        assert participants_set.call_args.kwargs["ttl"] == 60
+
+    def test_cached_results_are_copies(self, api_client):
+        """Test that mutating a returned result doesn't alter the cache."""
+        mock_response_data = {
+            "data": {
+                "reportData": {
+                    "report": {"fights": [{"id": 1, "name": "Test Boss"}]}
+                }
+            }
+        }
+
+        with patch.object(
+            api_client, "_make_api_request", return_value=mock_response_data
+        ):
+            fights = api_client.get_report_fights("test123")
+            fights[0]["name"] = "Changed"
+
+            assert api_client.get_report_fights("test123")[0]["name"] == (
+                "Test Boss"
+            )
+
+    def test_get_report_bundle_single_request(self, api_client):
+        """Test that a bundle fetches everything in one API request."""
+        mock_response_data = {
+            "data": {
+                "reportData": {
+                    "r0": {
+                        "title": "Test Report",
+                        "startTime": 1234567890,
+                        "endTime": 1234567899,
+                        "owner": {"name": "Test Owner"},
+                        "zone": {"name": "Test Zone"},
+                        "rankedCharacters": [
+                            {
+                                "id": 1,
+                                "canonicalID": 1,
+                                "name": "TestPlayer",
+                                "classID": 11,
+                            }
+                        ],
+                        "fights": [{"id": 1, "name": "Test Boss"}],
+                    }
+                }
+            }
+        }
+
+        with patch.object(
+            api_client, "_make_api_request", return_value=mock_response_data
+        ) as mock_request:
+            bundle = api_client.get_report_bundle("test123")
+            # Individual lookups are served from the populated caches
+            metadata = api_client.get_report_metadata("test123")
+            participants = api_client.get_report_participants("test123")
+
+        assert mock_request.call_count == 1
+        assert bundle["metadata"]["title"] == "Test Report"
+        assert bundle["participants"][0]["class"] == "Warrior"
+        assert bundle["fights"][0]["name"] == "Test Boss"
+        assert metadata == bundle["metadata"]
+        assert participants == bundle["participants"]
+
+    def test_get_report_bundles_uses_aliases(self, api_client):
+        """Test that several reports are fetched in one aliased query."""
+        mock_response_data = {
+            "data": {
+                "reportData": {
+                    "r0": {"title": "First", "fights": []},
+                    "r1": None,
+                }
+            }
+        }
+
+        with patch.object(
+            api_client, "_make_api_request", return_value=mock_response_data
+        ) as mock_request, patch.object(
+            api_client, "_get_participants_master_data", return_value=None
+        ):
+            bundles = api_client.get_report_bundles(["abc", "def"])
+
+        query, variables = mock_request.call_args.args
+        assert "r0: report(code: $c0)" in query
+        assert "r1: report(code: $c1)" in query
+        assert variables == {"c0": "abc", "c1": "def"}
+        assert bundles["abc"]["metadata"]["title"] == "First"
+        assert bundles["def"] is None
+
 
 class TestWrapperFunctions:
     """Test the wrapper functions that provide easy access to the API."""
@@ -441,6 +857,58 @@ class TestWrapperFunctions:
         assert result == [{"name": "Test Boss", "kill": True}]
         mock_api.get_report_fights.assert_called_once_with("test123")
 
+    @patch("app.utils.warcraftlogs.warcraftlogs_api")
+    def test_process_warcraftlogs_raid_single_fetch(self, mock_api):
+        """Test that processing a report fetches it with one bundle call."""
+        mock_api.get_report_bundle.return_value = {
+            "metadata": {"title": "Test Raid"},
+            "participants": [{"name": "Player1", "class": "Warrior"}],
+            "fights": [],
+        }
+        team_toons = [{"id": 1, "username": "Player1", "class": "Warrior"}]
+
+        result = process_warcraftlogs_raid(
+            "https://www.warcraftlogs.com/reports/abc123", team_toons
+        )
+
+        assert result["success"] is True
+        assert result["report_metadata"] == {"title": "Test Raid"}
+        mock_api.get_report_bundle.assert_called_once_with("abc123")
+        mock_api.get_report_metadata.assert_not_called()
+        mock_api.get_report_participants.assert_not_called()
+
+    @patch("app.utils.warcraftlogs.warcraftlogs_api")
+    def test_process_warcraftlogs_raid_missing_report(self, mock_api):
+        """Test that an unavailable report reports a metadata failure."""
+        mock_api.get_report_bundle.return_value = None
+
+        result = process_warcraftlogs_raid(
+            "https://www.warcraftlogs.com/reports/abc123", []
+        )
+
+        assert result["success"] is False
+        assert "metadata" in result["error"]
+
+    @patch("app.utils.warcraftlogs.process_warcraftlogs_raid")
+    @patch("app.utils.warcraftlogs.warcraftlogs_api")
+    def test_process_warcraftlogs_raids_prefetches_once(
+        self, mock_api, mock_process
+    ):
+        """Test that batch processing fetches all reports in one call."""
+        mock_process.side_effect = lambda url, toons, threshold: {"url": url}
+        urls = [
+            "https://www.warcraftlogs.com/reports/abc123",
+            "not a report url",
+            "https://www.warcraftlogs.com/reports/def456",
+        ]
+
+        results = process_warcraftlogs_raids(urls, [])
+
+        mock_api.get_report_bundles.assert_called_once_with(
+            ["abc123", "def456"]
+        )
+        assert [result["url"] for result in results] == urls
+
 
 class TestIntegrationScenarios:
     """Test integration scenarios and error handling."""
@@ -471,3 +939,18 @@ class TestIntegrationScenarios:
         result = fetch_report_fights("test123")
 
         assert result is None
+
+
+class TestBlockingCallers:
+    """Guard that blocking WarcraftLogs calls stay off the event loop."""
+
+    def test_warcraftlogs_routes_are_sync_handlers(self):
+        """
+        The WarcraftLogs client is synchronous, so routes using it must be
+        plain functions that FastAPI runs in its threadpool.
+        """
+        import inspect
+        from app.routers import raid
+
+        for handler in (raid.process_warcraftlogs_report, raid.create_raid):
+            assert not inspect.iscoroutinefunction(handler)
@@ -8,26 +8,27 @@ import os
 import sys
 import argparse
 from typing import Optional
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
 
 # Add the app directory to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "app"))
 
-from app.utils.warcraftlogs import (
-    extract_report_code,
-    fetch_report_metadata,
-    fetch_report_participants,
-    fetch_report_fights,
-)
+# dotenv and the WarcraftLogs client (requests, app settings) are imported
+# inside the test functions so --help doesn't pay for them.
 
 
 def test_warcraftlogs_integration(
     url: Optional[str] = None, test_type: str = "all"
 ):
     """Test the WarcraftLogs API integration."""
+    from dotenv import load_dotenv
+
+    # Load environment variables
+    load_dotenv()
+
+    from app.utils.warcraftlogs import (
+        extract_report_code,
+        fetch_report_metadata,
+    )
 
     # Check if credentials are set
     client_id = os.getenv("WARCRAFTLOGS_CLIENT_ID")
@@ -110,6 +111,8 @@ def test_warcraftlogs_integration(
 
 def test_participants(report_code: str) -> bool:
     """Test participant data fetching."""
+    from app.utils.warcraftlogs import fetch_report_participants
+
     print("\n👥 Fetching participant data...")
     participants = fetch_report_participants(report_code)
 
@@ -128,6 +131,8 @@ def test_participants(report_code: str) -> bool:
 
 def test_fights(report_code: str) -> bool:
     """Test fight data fetching."""
+    from app.utils.warcraftlogs import fetch_report_fights
+
     print("\n⚔️ Fetching fight data...")
     fights = fetch_report_fights(report_code)
 
@@ -147,6 +152,10 @@ def test_fights(report_code: str) -> bool:
         return False
 
 
+# Interactive menu choice -> --type value
+TEST_CHOICES = {"1": "all", "2": "participants", "3": "fights"}
+
+
 def interactive_mode():
     """Run the test script in interactive mode."""
     print("🔧 WarcraftLogs API Test - Interactive Mode")
@@ -172,17 +181,10 @@ def interactive_mode():
 
     while True:
         choice = input("\nEnter your choice (1-3): ").strip()
-        if choice == "1":
-            test_type = "all"
-            break
-        elif choice == "2":
-            test_type = "participants"
+        test_type = TEST_CHOICES.get(choice)
+        if test_type:
             break
-        elif choice == "3":
-            test_type = "fights"
-            break
-        else:
-            print("❌ Invalid choice. Please enter 1, 2, or 3.")
+        print("❌ Invalid choice. Please enter 1, 2, or 3.")
 
     return test_warcraftlogs_integration(url, test_type)
 